@@ -200,16 +200,7 @@ def generationObjets(self, _keyObjet, _valueObjet) :
        if valueExiste('is mandatory', _valueObjet) : _mObjetQSaisie.setProperty("mandatoryField", True if _valueObjet['is mandatory'] else False)
        #QRegularExpression                        
        if _valueObjet['regex validator pattern'] != None :
-          re = QRegularExpression(_valueObjet['regex validator pattern'])
-          if _valueObjet['regex validator flags']:
-              if "i" in _valueObjet['regex validator flags']:
-                 re.setPatternOptions(QRegularExpression.CaseInsensitiveOption)
-              if "s" in _valueObjet['regex validator flags']:
-                 re.setPatternOptions(QRegularExpression.DotMatchesEverythingOption)
-              if "m" in _valueObjet['regex validator flags']:
-                 re.setPatternOptions(QRegularExpression.MultilineOption)
-              if "x" in _valueObjet['regex validator flags']:
-                 re.setPatternOptions(QRegularExpression.ExtendedPatternSyntaxOption)
+          re = regularExpression(_valueObjet['regex validator pattern'], _valueObjet['regex validator flags'])
           _mObjetQSaisie.setValidator(QRegularExpressionValidator(re, _mObjetQSaisie))
        
        #========== 
@@ -1134,6 +1125,27 @@ def valueExiste(_var, _dict) :
        _ret = True
     return _ret
     
+#==================================================
+# Expressions régulières des validateurs, construites une seule fois
+# par couple (motif, paramètres) puis réutilisées pour tous les widgets
+_regularExpressions = {}
+
+def regularExpression(_pattern, _flags) :
+    _key = (_pattern, _flags)
+    if _key not in _regularExpressions :
+       re = QRegularExpression(_pattern)
+       if _flags:
+           if "i" in _flags:
+              re.setPatternOptions(QRegularExpression.CaseInsensitiveOption)
+           if "s" in _flags:
+              re.setPatternOptions(QRegularExpression.DotMatchesEverythingOption)
+           if "m" in _flags:
+              re.setPatternOptions(QRegularExpression.MultilineOption)
+           if "x" in _flags:
+              re.setPatternOptions(QRegularExpression.ExtendedPatternSyntaxOption)
+       _regularExpressions[_key] = re
+    return _regularExpressions[_key]
+    
 
 #==================================================
 # FIN
@@ -217,6 +217,7 @@ def saveMetaIhm(self, _schema, _table) :
 
     #-    
     # Enregistrer dans le dictionnaire de widgets les valeurs contenues dans les widgets de saisie.
+    _values = []
     for _keyObjet, _valueObjet in self.mDicObjetsInstancies.items() :
         if _valueObjet['main widget type'] != None :
            value = None
@@ -234,7 +235,8 @@ def saveMetaIhm(self, _schema, _table) :
               value = (True if _valueObjet['main widget'].checkState() == Qt.Checked else False) if  _valueObjet['main widget'].checkState() != Qt.PartiallyChecked else None
 
            if _valueObjet['object'] == "edit" and not (_valueObjet['hidden']): 
-              self.mDicObjetsInstancies.update_value(_keyObjet, value)
+              _values.append((_keyObjet, value))
+    self.mDicObjetsInstancies.update_values(_values)
     #-    
     #Générer un graphe RDF à partir du dictionnaire de widgets actualisé 
     self.metagraph = self.mDicObjetsInstancies.build_metagraph()        
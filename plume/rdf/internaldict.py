@@ -145,25 +145,29 @@ class InternalDict(dict):
       les informations nécessaires pour exécuter le calcul de la métadonnée.
     
     """
-    
+    __slots__ = ()
+
+    _blank = dict.fromkeys((
+        'object', 'main widget type',
+        # stockage des widgets :
+        'main widget', 'grid widget', 'label widget', 'minus widget',
+        'language widget', 'switch source widget', 'unit widget', 'geo widget',
+        'compute widget',
+        # stockage des menus, actions, etc. :
+        'switch source menu', 'switch source actions', 'language menu',
+        'language actions', 'unit menu', 'unit actions', 'geo menu', 'geo actions',
+        # paramétrage des widgets :
+        'hidden', 'label', 'has label', 'help text', 'value', 'placeholder text',
+        'input mask', 'is mandatory', 'read only', 'has minus button',
+        'hide minus button', 'regex validator pattern', 'regex validator flags',
+        'type validator', 'multiple sources', 'sources', 'current source',
+        'thesaurus values', 'authorized languages', 'language value', 'units',
+        'current unit', 'geo tools', 'has compute button', 'auto compute',
+        'compute method'
+        ))
+    # dictionnaire modèle, dont chaque nouveau dictionnaire
+    # interne est une copie
+
     def __init__(self):
-        keys = [
-            'object', 'main widget type',
-            # stockage des widgets :
-            'main widget', 'grid widget', 'label widget', 'minus widget',
-            'language widget', 'switch source widget', 'unit widget', 'geo widget',
-            'compute widget',
-            # stockage des menus, actions, etc. :
-            'switch source menu', 'switch source actions', 'language menu',
-            'language actions', 'unit menu', 'unit actions', 'geo menu', 'geo actions',
-            # paramétrage des widgets :
-            'hidden', 'label', 'has label', 'help text', 'value', 'placeholder text',
-            'input mask', 'is mandatory', 'read only', 'has minus button',
-            'hide minus button', 'regex validator pattern', 'regex validator flags',
-            'type validator', 'multiple sources', 'sources', 'current source',
-            'thesaurus values', 'authorized languages', 'language value', 'units',
-            'current unit', 'geo tools', 'has compute button', 'auto compute',
-            'compute method'
-            ]
-        self.update({ k:None for k in keys })
+        dict.__init__(self, InternalDict._blank)
 
@@ -115,6 +115,25 @@ class PlumeProperty:
         else:
             raise RuntimeError("Pas assez d'arguments pour définir une propriété.")    
 
+    def copy(self):
+        """Renvoie une copie de la catégorie.
+        
+        Le dictionnaire :py:attr:`PlumeProperty.prop_dict` est
+        lui-même copié, de même que les listes qu'il contient,
+        de sorte que la copie puisse être modifiée sans altérer
+        l'original.
+        
+        Returns
+        -------
+        PlumeProperty
+        
+        """
+        prop = PlumeProperty.__new__(PlumeProperty)
+        prop.__dict__.update(self.__dict__)
+        prop.prop_dict = {k: v.copy() if isinstance(v, list) else v
+            for k, v in self.prop_dict.items()}
+        return prop
+
 def merge_property_dict(shape_dict, template_dict):
     """Fusionne deux dictionnaires décrivant une même catégorie de métadonnées.
     
@@ -187,6 +187,27 @@ class PlumePropertyTestCase(unittest.TestCase):
                     self.assertListEqual(p.prop_dict['geo_tools'],
                         ['point', 'rectangle'])
         self.assertEqual(t, 1)
+
+    def test_copy(self):
+        """Copie d'une catégorie commune.
+        
+        """
+        nsm = PlumeNamespaceManager()
+        properties, predicates = class_properties(rdfclass=DCAT.Dataset,
+            nsm=nsm, base_path=None)
+        for p in properties:
+            if p.n3_path == 'dcat:theme':
+                break
+        c = p.copy()
+        self.assertIsInstance(c, PlumeProperty)
+        self.assertEqual(c.prop_dict, p.prop_dict)
+        self.assertEqual(c.n3_path, p.n3_path)
+        self.assertEqual(c.path, p.path)
+        self.assertEqual(c.unlisted, p.unlisted)
+        c.prop_dict['parent'] = 'x'
+        c.prop_dict['sources'].append(URIRef('http://machin'))
+        self.assertFalse('parent' in p.prop_dict)
+        self.assertFalse(URIRef('http://machin') in p.prop_dict['sources'])
         
 
 if __name__ == '__main__':
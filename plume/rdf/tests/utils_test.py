@@ -8,7 +8,8 @@ from plume.rdf.utils import sort_by_language, pick_translation, \
     wkt_with_srid, split_rdf_wkt, str_from_datetime, str_from_date, \
     str_from_time, datetime_from_str, date_from_str, time_from_str, \
     str_from_decimal, decimal_from_str, main_datatype, geomtype_from_wkt, \
-    export_format_from_extension, export_formats
+    export_format_from_extension, export_formats, langstring_from_str, \
+    uriref_from_str
 from plume.rdf.namespaces import PlumeNamespaceManager, DCT, XSD, RDF
 
 nsm = PlumeNamespaceManager()
@@ -201,6 +202,29 @@ class UtilsTestCase(unittest.TestCase):
         self.assertIsNone(date_from_str('32/02/2022'))
         self.assertIsNone(date_from_str('10/13/2022'))
 
+    def test_langstring_from_str(self):
+        """Désérialisation en littéral RDF d'une chaîne de caractères avec une langue.
+        
+        """
+        for i in range(2):
+            l = langstring_from_str('Métadonnées', 'fr')
+            self.assertEqual(l, Literal('Métadonnées', lang='fr'))
+            self.assertEqual(l.language, 'fr')
+            self.assertIsNone(l.datatype)
+            self.assertEqual(l.toPython(), 'Métadonnées')
+            self.assertEqual(l.n3(), '"Métadonnées"@fr')
+        with self.assertRaises(Exception):
+            langstring_from_str('Métadonnées', 'pas une langue')
+
+    def test_uriref_from_str(self):
+        """Génération d'IRI à partir de chaînes de caractères.
+        
+        """
+        iri = uriref_from_str('https://www.postgresql.org/docs/14/index.html')
+        self.assertEqual(iri, URIRef('https://www.postgresql.org/docs/14/index.html'))
+        self.assertIsInstance(iri, URIRef)
+        self.assertIs(uriref_from_str('https://www.postgresql.org/docs/14/index.html'), iri)
+
     def test_str_from_decimal(self):
         """Représentation d'un décimal RDF sous forme de chaîne de caractères.
         
@@ -377,6 +401,13 @@ class UtilsTestCase(unittest.TestCase):
         sort_by_language(l1, langlist)
         self.assertEqual(l1, l2) 
 
+        # langue en double dans la liste
+        l3 = [Literal('Mein Titel', lang='de'), Literal('My Title', lang='en'),
+            Literal('Mon titre', lang='fr')]
+        sort_by_language(l3, ('fr', 'fr', 'en'))
+        self.assertEqual(l3, [Literal('Mon titre', lang='fr'),
+            Literal('My Title', lang='en'), Literal('Mein Titel', lang='de')])
+
     def test_pick_translation(self):
         """Choix d'une traduction.
         
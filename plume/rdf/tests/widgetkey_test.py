@@ -238,6 +238,44 @@ class WidgetKeyTestCase(unittest.TestCase):
         self.assertTrue(t in actionsbook.drop)
         self.assertTrue(gp3 in actionsbook.drop)
 
+    def test_clean_twins(self):
+        """Nettoyage d'un arbre contenant des clés jumelles.
+        
+        """
+        # groupe de propriétés vide, dont la jumelle
+        # clé-valeur doit être préservée, en l'absence
+        # de bouton de sélection de la source
+        WidgetKey.with_source_buttons = False
+        try:
+            r = RootKey()
+            g = GroupOfPropertiesKey(parent=r, rdfclass=DCT.RightsStatement,
+                predicate=DCT.accessRights)
+            m = ValueKey(parent=r, m_twin=g, is_hidden_m=True)
+            self.assertFalse(m.is_main_twin)
+            self.assertFalse(m.has_source_button)
+            actionsbook = r.clean()
+            self.assertFalse(g in r.children)
+            self.assertTrue(m in r.children)
+            self.assertIsNone(m.m_twin)
+            self.assertFalse(m.is_hidden)
+            self.assertListEqual(actionsbook.drop, [g])
+        finally:
+            WidgetKey.reinitiate_shared_attributes()
+
+        # groupe dont la seule fille réelle est supprimée
+        r = RootKey()
+        gp = GroupOfPropertiesKey(parent=r, rdfclass=DCT.ProvenanceStatement,
+            predicate=DCT.provenance)
+        v = ValueKey(parent=gp, predicate=RDFS.label, is_ghost=True,
+            value=Literal('Ma provenance', lang='fr'))
+        gp2 = GroupOfPropertiesKey(parent=gp, rdfclass=DCT.RightsStatement,
+            predicate=DCT.accessRights)
+        actionsbook = r.clean()
+        self.assertFalse(gp2 in gp.children)
+        self.assertTrue(v in gp.children)
+        self.assertTrue(gp.is_ghost)
+        self.assertListEqual(actionsbook.drop, [gp2, gp])
+
     def test_tree_keys(self):
         """Itérateur sur les clés non fantômes de l'arbre.
         
@@ -263,6 +301,18 @@ class WidgetKeyTestCase(unittest.TestCase):
         self.assertEqual(g.predicate, DCT.accessRights)
         self.assertEqual(g.label, "Conditions d'accès")
 
+        # propriétés sans objet pour un groupe de traduction,
+        # silencieusement ignorées
+        t = TranslationGroupKey(parent=g, predicate=RDFS.label)
+        t.update(rdfclass=DCT.RightsStatement, sources=[URIRef('http://machin')],
+            transform='email', label='Libellé')
+        self.assertIsNone(t.rdfclass)
+        self.assertIsNone(t.sources)
+        self.assertIsNone(t.transform)
+        self.assertEqual(t.label, 'Libellé')
+        t.transform = 'phone'
+        self.assertIsNone(t.transform)
+
     def test_lang_attributes(self):
         """Gestion des propriétés de classe, `langlist` et `main_language`.
         
@@ -300,7 +350,24 @@ class WidgetKeyTestCase(unittest.TestCase):
         o = TabKey(parent=r, label='Mon onglet')
         v = ValueKey(parent=o, predicate=DCT.title, datatype=RDF.langString)
         self.assertEqual(r.search_from_path(DCT.title), v)
-    
+
+    def test_search_rdfclass(self):
+        """Recherche des groupes de propriétés d'une classe donnée.
+
+        """
+        r = RootKey()
+        o = TabKey(parent=r, label='Mon onglet')
+        g1 = GroupOfPropertiesKey(parent=o, rdfclass=DCT.RightsStatement,
+            predicate=DCT.accessRights)
+        g2 = GroupOfValuesKey(parent=o, rdfclass=FOAF.Agent,
+            predicate=DCT.publisher)
+        g2a = GroupOfPropertiesKey(parent=g2)
+        g2b = GroupOfPropertiesKey(parent=g2, is_ghost=True)
+        g2c = GroupOfPropertiesKey(parent=g2)
+        self.assertListEqual(r.search_from_rdfclass(DCT.RightsStatement), [g1])
+        self.assertListEqual(r.search_from_rdfclass(FOAF.Agent), [g2a, g2c])
+        self.assertListEqual(r.search_from_rdfclass(DCAT.Distribution), [])
+
     def test_root_key(self):
         """Initialisation d'une clé racine.
         
@@ -533,6 +600,31 @@ class WidgetKeyTestCase(unittest.TestCase):
         groupkey2.compute_single_children()
         self.assertTrue(valkey2.is_single_child)
 
+    def test_bulk_update(self):
+        """Calcul des lignes et filles uniques différé à la sortie du contexte.
+
+        """
+        rootkey = RootKey()
+        groupkey = GroupOfValuesKey(parent=rootkey, predicate=DCT.title)
+        buttonkey = PlusButtonKey(parent=groupkey)
+        valkey1 = ValueKey(parent=groupkey)
+        self.assertTrue(valkey1.is_single_child)
+        with WidgetKey.bulk_update():
+            valkey2 = ValueKey(parent=groupkey)
+            with WidgetKey.bulk_update():
+                valkey3 = ValueKey(parent=groupkey)
+            self.assertIsNone(valkey2.row)
+            self.assertIsNone(valkey3.row)
+            self.assertTrue(valkey1.is_single_child)
+            self.assertEqual(buttonkey.row, 1)
+        self.assertEqual(valkey1.row, 0)
+        self.assertEqual(valkey2.row, 1)
+        self.assertEqual(valkey3.row, 2)
+        self.assertEqual(buttonkey.row, 3)
+        self.assertFalse(valkey1.is_single_child)
+        self.assertFalse(valkey3.is_single_child)
+        self.assertFalse(WidgetKey._pending_groups)
+
     def test_actionsbook(self):
         rootkey = RootKey()
         WidgetKey.langlist=['fr', 'en', 'it']
@@ -649,7 +741,71 @@ class WidgetKeyTestCase(unittest.TestCase):
             with self.subTest(actionsbook_attr = a):
                 if not a in ('modified', 'units', 'update'):
                     self.assertFalse(getattr(actionsbook, a))
-        
+
+    def test_empty_actionsbook(self):
+        """Carnet d'actions vierge renvoyé par les actions sans effet.
+
+        """
+        rootkey = RootKey()
+        groupkey = GroupOfPropertiesKey(parent=rootkey,
+            rdfclass=DCT.RightsStatement, predicate=DCT.accessRights)
+        valkey = ValueKey(parent=rootkey, m_twin=groupkey,
+            is_hidden_m=True, sources=[
+            URIRef('http://purl.org/eu/metadata/dcat-ap-cs/access-right')])
+        groupkey3 = GroupOfPropertiesKey(parent=rootkey,
+            rdfclass=FOAF.Agent, predicate=DCT.publisher)
+        ValueKey(parent=rootkey, m_twin=groupkey3, is_hidden_m=False)
+        groupkey2 = GroupOfValuesKey(parent=groupkey3, predicate=DCT.title)
+        buttonkey = PlusButtonKey(parent=groupkey2)
+        ValueKey(parent=groupkey2)
+        self.assertTrue(valkey.is_hidden)
+        self.assertTrue(buttonkey.is_hidden)
+        for a in (valkey.change_language('en'), valkey.change_source(None),
+            valkey.change_unit('ans'), valkey.switch_twin(),
+            buttonkey.add(), valkey.drop()):
+            self.assertIs(a, WidgetKey.EMPTY_ACTIONSBOOK)
+        self.assertFalse(WidgetKey.EMPTY_ACTIONSBOOK)
+
+    def test_first_real_child(self):
+        """Recherche de la première fille non fantôme d'un groupe.
+
+        """
+        rootkey = RootKey()
+        groupkey = GroupOfValuesKey(parent=rootkey, predicate=DCT.title)
+        self.assertIsNone(groupkey.first_real_child())
+        ValueKey(parent=groupkey, is_ghost=True,
+            value=Literal('fantôme'))
+        self.assertIsNone(groupkey.first_real_child())
+        valkey1 = ValueKey(parent=groupkey)
+        ValueKey(parent=groupkey)
+        self.assertIs(groupkey.first_real_child(), valkey1)
+        buttonkey = PlusButtonKey(parent=groupkey)
+        buttonkey.add()
+        self.assertEqual(len(list(groupkey.real_children())), 3)
+
+    def test_actions_scope(self):
+        """Délimitation d'une action par un gestionnaire de contexte.
+
+        """
+        rootkey = RootKey()
+        groupkey = GroupOfValuesKey(parent=rootkey, predicate=DCT.title)
+        valkey1 = ValueKey(parent=groupkey)
+        valkey2 = ValueKey(parent=groupkey)
+        with WidgetKey.actions_scope() as actionsbook:
+            self.assertIs(WidgetKey.actionsbook, actionsbook)
+            self.assertFalse(actionsbook)
+            valkey1.kill()
+        self.assertIsNot(WidgetKey.actionsbook, actionsbook)
+        self.assertFalse(WidgetKey.actionsbook)
+        self.assertListEqual(actionsbook.drop, [valkey1])
+        actionsbook2 = valkey2.drop()
+        self.assertIsNot(actionsbook2, actionsbook)
+        self.assertListEqual(actionsbook.drop, [valkey1])
+        with WidgetKey.actions_scope(append_book=True) as actionsbook3:
+            ValueKey(parent=groupkey)
+        self.assertIs(WidgetKey.actionsbook, actionsbook3)
+        self.assertEqual(len(actionsbook3.create), 1)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -15,7 +15,8 @@ from plume.rdf.namespaces import DCAT, DCT, OWL, LOCAL, XSD, VCARD, SKOS, FOAF,
 from plume.rdf.widgetkey import GroupOfPropertiesKey, ValueKey
 from plume.rdf.metagraph import Metagraph
 from plume.rdf.rdflib import isomorphic, Literal, URIRef
-from plume.rdf.exceptions import ForbiddenOperation
+from plume.rdf.exceptions import ForbiddenOperation, UnknownSource
+from plume.rdf.thesaurus import Thesaurus
 
 from plume.pg.tests.connection import ConnectionString
 from plume.pg.queries import query_get_categories, query_template_tabs, query_exists_extension
@@ -1696,6 +1697,9 @@ class WidgetsDictTestCase(unittest.TestCase):
         widgetsdict.update_value(c, 'Metropolitan Departments (Admin Express)')
         self.assertEqual(c.value, Literal('Metropolitan Departments (Admin Express)', lang='en'))
         self.assertEqual(widgetsdict[c]['value'], 'Metropolitan Departments (Admin Express)')
+        value = c.value
+        widgetsdict.update_value(c, 'Metropolitan Departments (Admin Express)')
+        self.assertIs(c.value, value)
 
         # --- litéral sans langue ---
         c = widgetsdict.root.search_from_path(OWL.versionInfo)
@@ -1729,6 +1733,9 @@ class WidgetsDictTestCase(unittest.TestCase):
         widgetsdict.update_value(c, '999')
         self.assertEqual(c.value, Literal('999', datatype=XSD.integer))
         self.assertEqual(widgetsdict[c]['value'], '999')
+        value = c.value
+        widgetsdict.update_value(c, '999')
+        self.assertIs(c.value, value)
         
         # --- décimal ---
         c = widgetsdict.root.search_from_path(LOCAL['9ade6b00-a16a-424c-af8f-9c4bfb2a92f9'])
@@ -1926,6 +1933,9 @@ class WidgetsDictTestCase(unittest.TestCase):
             LOCAL['6e855e63-5f6e-47eb-ab28-4db4124c172e']).children[1]
         self.assertEqual(k.datatype, XSD.dateTime)
         self.assertEqual(widgetsdict[k]['value'], '14/02/2022 00:00:00')
+        self.assertEqual(len([k for k in widgetsdict
+            if not isinstance(k, ValueKey)
+            and k.path == LOCAL['6e855e63-5f6e-47eb-ab28-4db4124c172e']]), 1)
         k = widgetsdict.root.search_from_path(LOCAL['3028ca2c-73eb-4707-80ea-69210eeffb97'])
         self.assertIsNone(k.datatype)
         self.assertIsNotNone(k.rdfclass)
@@ -2367,6 +2377,76 @@ class WidgetsDictTestCase(unittest.TestCase):
                 columns.remove(k)
         self.assertFalse(columns)
 
+    def test_thesaurus_label_and_values(self):
+        """Mémorisation des libellés et termes des thésaurus.
+        
+        """
+        widgetsdict = WidgetsDict(langList=['en', 'fr'])
+        source = URIRef('http://registre.data.developpement-durable.gouv.fr/plume/CrpaAccessLimitations')
+        label = widgetsdict.thesaurus_label(source)
+        self.assertEqual(label, Thesaurus.get_label((source, ('en', 'fr'))))
+        self.assertIs(widgetsdict.thesaurus_label(source), label)
+        values = widgetsdict.thesaurus_values(source)
+        self.assertEqual(values, Thesaurus.get_values((source, ('en', 'fr'))))
+        self.assertIs(widgetsdict.thesaurus_values(source), values)
+        with self.assertRaises(UnknownSource):
+            widgetsdict.thesaurus_label(URIRef('http://machin'))
+        self.assertFalse(URIRef('http://machin') in widgetsdict._thesaurus_labels)
+
+    def test_read_mode_empty_twin(self):
+        """Préservation en mode lecture de la clé-valeur jumelle d'un groupe de propriétés vide.
+        
+        """
+        for access_rights in ('[ ]', '[ a dct:RightsStatement ]',
+            '[ <http://machin/chose> "chose" ]'):
+            metadata = """
+                @prefix dcat: <http://www.w3.org/ns/dcat#> .
+                @prefix dct: <http://purl.org/dc/terms/> .
+                
+                <urn:uuid:479fd670-32c5-4ade-a26d-0268b0ce5046> a dcat:Dataset ;
+                    dct:title "ADMIN EXPRESS - Départements de métropole"@fr ;
+                    dct:accessRights {} .
+                """.format(access_rights)
+            metagraph = Metagraph().parse(data=metadata)
+            widgetsdict = WidgetsDict(metagraph=metagraph, mode='read')
+            keys = [k for k in widgetsdict
+                if getattr(k, 'path', None) == DCT.accessRights]
+            self.assertEqual(len(keys), 1, access_rights)
+            self.assertIsInstance(keys[0], ValueKey)
+            self.assertIsNone(keys[0].m_twin)
+
+    def test_update_values(self):
+        """Mise à jour groupée des valeurs des clés.
+        
+        """
+        metadata = """
+            @prefix dcat: <http://www.w3.org/ns/dcat#> .
+            @prefix dct: <http://purl.org/dc/terms/> .
+            @prefix owl: <http://www.w3.org/2002/07/owl#> .
+            
+            <urn:uuid:479fd670-32c5-4ade-a26d-0268b0ce5046> a dcat:Dataset ;
+                dct:title "ADMIN EXPRESS - Départements de métropole"@fr ;
+                owl:versionInfo "1.0" .
+            """
+        metagraph = Metagraph().parse(data=metadata)
+        widgetsdict = WidgetsDict(metagraph=metagraph)
+        t = widgetsdict.root.search_from_path(DCT.title)
+        v = widgetsdict.root.search_from_path(OWL.versionInfo)
+        d = widgetsdict.root.search_from_path(DCT.modified)
+        widgetsdict[t]['value'] = 'non recalculé'
+        widgetsdict.update_values([
+            (t, 'ADMIN EXPRESS - Départements de métropole'),
+            (v, '2.0'),
+            (d, '21/01/2021'),
+            (widgetsdict.root, 'chose')
+            ])
+        self.assertEqual(t.value, Literal('ADMIN EXPRESS - Départements de métropole', lang='fr'))
+        self.assertEqual(widgetsdict[t]['value'], 'non recalculé')
+        self.assertEqual(v.value, Literal('2.0'))
+        self.assertEqual(widgetsdict[v]['value'], '2.0')
+        self.assertEqual(d.value, Literal('2021-01-21', datatype=XSD.date))
+        self.assertEqual(widgetsdict[d]['value'], '21/01/2021')
+
 if __name__ == '__main__':
     unittest.main()
 
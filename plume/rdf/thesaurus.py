@@ -97,12 +97,10 @@ class Thesaurus:
         ['', 'Licence Ouverte version 2.0', 'ODC Open Database License (ODbL) version 1.0']
         
         """
-        if thesaurus in cls.collection:
-            return cls.collection[thesaurus].values
-        t = Thesaurus(*thesaurus)
-        if t:
-            return t.values
-        raise UnknownSource(thesaurus[0])
+        t = cls.collection.get(thesaurus)
+        if t is None:
+            t = Thesaurus(*thesaurus)
+        return t.values
     
     @classmethod
     def get_label(cls, thesaurus):
@@ -139,12 +137,10 @@ class Thesaurus:
         "Restrictions d'accès en application du Code des relations entre le public et l'administration"
         
         """
-        if thesaurus in cls.collection:
-            return cls.collection[thesaurus].label
-        t = Thesaurus(*thesaurus)
-        if t:
-            return t.label
-        raise UnknownSource(thesaurus[0])
+        t = cls.collection.get(thesaurus)
+        if t is None:
+            t = Thesaurus(*thesaurus)
+        return t.label
     
     @classmethod
     def concept_iri(cls, thesaurus, concept_str):
@@ -188,12 +184,10 @@ class Thesaurus:
         rdflib.term.URIRef('http://registre.data.developpement-durable.gouv.fr/plume/CrpaAccessLimitations/L311-6-1-vp')
         
         """
-        if thesaurus in cls.collection:
-            return cls.collection[thesaurus].iri_from_str.get(concept_str)
-        t = Thesaurus(*thesaurus)
-        if t:
-            return t.iri_from_str.get(concept_str)
-        raise UnknownSource(thesaurus[0])
+        t = cls.collection.get(thesaurus)
+        if t is None:
+            t = Thesaurus(*thesaurus)
+        return t.iri_from_str.get(concept_str)
     
     @classmethod
     def concept_str(cls, thesaurus, concept_iri):
@@ -237,12 +231,10 @@ class Thesaurus:
         'Communicable au seul intéressé - atteinte à la protection de la vie privée (CRPA, L311-6 1°)'
         
         """
-        if thesaurus in cls.collection:
-            return cls.collection[thesaurus].str_from_iri.get(concept_iri)
-        t = Thesaurus(*thesaurus)
-        if t:
-            return t.str_from_iri.get(concept_iri)
-        raise UnknownSource(thesaurus[0])
+        t = cls.collection.get(thesaurus)
+        if t is None:
+            t = Thesaurus(*thesaurus)
+        return t.str_from_iri.get(concept_iri)
     
     @classmethod
     def concept_link(cls, thesaurus, concept_iri):
@@ -285,12 +277,10 @@ class Thesaurus:
         rdflib.term.URIRef('https://www.legifrance.gouv.fr/codes/article_lc/LEGIARTI000037269056')
         
         """
-        if thesaurus in cls.collection:
-            return cls.collection[thesaurus].links_from_iri.get(concept_iri)
-        t = Thesaurus(*thesaurus)
-        if t:
-            return t.links_from_iri.get(concept_iri)
-        raise UnknownSource(thesaurus[0])
+        t = cls.collection.get(thesaurus)
+        if t is None:
+            t = Thesaurus(*thesaurus)
+        return t.links_from_iri.get(concept_iri)
     
     @classmethod
     def concept_source(cls, concept_iri):
@@ -8,6 +8,7 @@ from html import escape
 from datetime import datetime, date, time
 from locale import setlocale, LC_NUMERIC, str as locstr
 from decimal import Decimal
+from functools import lru_cache
 
 from plume import __path__
 from plume.rdf.rdflib import Literal, URIRef, from_n3, Graph
@@ -22,6 +23,21 @@ crs_ns = {
 
 """
 
+# expressions régulières des fonctions de conversion des
+# adresses mél et numéros de téléphone, compilées une fois
+# pour toutes
+_FORBIDDEN_CHAR_RE = re.compile(r'[<>"\s{}|\\^`]')
+_TEL_SEP_RE = re.compile(r'[.\s-]')
+_DIGIT_SPACE_RE = re.compile(r'(\d)\s(\d)')
+
+# la construction accélérée des littéraux avec une langue
+# repose sur les attributs internes de rdflib.term.Literal
+_FAST_LANGSTRING = getattr(Literal, '__slots__', None) \
+    == ('_language', '_datatype', '_value')
+
+# langues déjà validées par le constructeur de rdflib.term.Literal
+_checked_languages = set()
+
 class DatasetId(URIRef):
     """Identifiant de jeu de données.
     
@@ -54,19 +70,22 @@ class DatasetId(URIRef):
     
     """
     def __new__(cls, *uuids):
-        if uuids:
-            for uuid in uuids:
-                if isinstance(uuid, DatasetId):
-                    return uuid
-                try:
-                    u = UUID(str(uuid))
-                    return super().__new__(cls, u.urn)
-                except:
-                    continue
-        return super().__new__(cls, uuid4().urn)
-    
-    def __init__(self, *uuids):
-        self.uuid = UUID(str(self))
+        u = None
+        for uuid in uuids:
+            if isinstance(uuid, DatasetId):
+                return uuid
+            try:
+                u = UUID(str(uuid))
+                break
+            except:
+                continue
+        if u is None:
+            u = uuid4()
+        # un URN d'UUID étant nécessairement un IRI valide, on
+        # fait l'économie du contrôle réalisé par URIRef.__new__
+        datasetid = str.__new__(cls, u.urn)
+        datasetid.uuid = u
+        return datasetid
 
 def data_from_file(filepath):
     """Renvoie le contenu d'un fichier.
@@ -139,8 +158,14 @@ def sort_by_language(litlist, langlist):
         Une liste de langues, triées par priorité décroissante.
 
     """
-    litlist.sort(key=lambda v: langlist.index(v.language) \
-        if isinstance(v, Literal) and v.language in langlist else 9999)
+    rank = {}
+    for i, language in enumerate(langlist):
+        rank.setdefault(language, i)
+    # rang des valeurs dont la langue n'est pas listée, au-delà
+    # de tous les rangs possibles même si langlist a des doublons
+    no_rank = len(langlist)
+    litlist.sort(key=lambda v: rank.get(v.language, no_rank) \
+        if isinstance(v, Literal) else no_rank)
 
 def pick_translation(litlist, langlist):
     """Renvoie l'élément de la liste dont la langue est la mieux adaptée.
@@ -330,8 +355,8 @@ def forbidden_char(anystr):
     ' '
     
     """
-    r = re.search(r'([<>"\s{}|\\^`])', anystr)
-    return r[1] if r else None
+    r = _FORBIDDEN_CHAR_RE.search(anystr)
+    return r[0] if r else None
 
 def text_with_link(anystr, anyiri):
     """Génère un fragment HTML définissant un lien.
@@ -359,10 +384,48 @@ def text_with_link(anystr, anyiri):
     
     """
     return """<a href="{}">{}</a>""".format(
-        escape(str(anyiri), quote=True),
-        escape(anystr, quote=True)
+        _escape(anyiri),
+        _escape(anystr)
         )
+
+@lru_cache(maxsize=8192)
+def _escape(anystr):
+    """Échappe les caractères spéciaux HTML d'une chaîne de caractères.
+    
+    Les mêmes IRI et libellés étant affichés à chaque génération
+    du formulaire, le résultat est mémorisé.
+    
+    """
+    return escape(anystr, quote=True)
+    
+@lru_cache(maxsize=2048)
+def uriref_from_str(value):
+    """Renvoie l'IRI correspondant à une chaîne de caractères.
+    
+    Parameters
+    ----------
+    value : str
+        Une chaîne de caractères représentant un IRI.
+    
+    Returns
+    -------
+    rdflib.term.URIRef
+    
+    Examples
+    --------
+    >>> uriref_from_str('https://www.postgresql.org/docs/14/index.html')
+    rdflib.term.URIRef('https://www.postgresql.org/docs/14/index.html')
+    
+    Notes
+    -----
+    Les IRI étant immuables, ceux qui ont déjà été générés sont
+    mémorisés et réutilisés, ce qui évite de refaire les contrôles
+    du constructeur de RDFLib lorsqu'une même valeur est
+    enregistrée plusieurs fois.
     
+    """
+    return URIRef(value)
+
 def email_from_owlthing(thing_iri):
     """Renvoie la transcription sous forme de chaîne de caractères d'un IRI représentant une adresse mél.
 
@@ -387,7 +450,10 @@ def email_from_owlthing(thing_iri):
     """
     # à partir de Python 3.9
     # str(thingIRI).removeprefix("mailto:") serait plus élégant
-    return re.sub('^mailto[:]', '', str(thing_iri))
+    email_str = str(thing_iri)
+    if email_str.startswith('mailto:'):
+        return email_str[7:]
+    return email_str
 
 def owlthing_from_email(email_str):
     """Construit un IRI valide à partir d'une chaîne de caractères représentant une adresse mél.
@@ -413,14 +479,15 @@ def owlthing_from_email(email_str):
     rdflib.term.URIRef('mailto:jon.snow@the-wall.we')
     
     """
-    email_str = re.sub('^mailto[:]', '', email_str)
+    if email_str.startswith('mailto:'):
+        email_str = email_str[7:]
     f = forbidden_char(email_str)
     if f:
         raise ValueError("Le caractère '{}' " \
             "de l'adresse '{}' n'est pas autorisé dans " \
             'un IRI.'.format(f, email_str))
     if email_str:
-        return URIRef('mailto:' + email_str)
+        return uriref_from_str('mailto:' + email_str)
 
 def tel_from_owlthing(thing_iri):
     """Renvoie la transcription sous forme de chaîne de caractères d'un IRI représentant un numéro de téléphone.
@@ -445,7 +512,10 @@ def tel_from_owlthing(thing_iri):
     '+33-1-23-45-67-89'
     
     """
-    return re.sub('^tel[:]', '', str(thing_iri))
+    tel_str = str(thing_iri)
+    if tel_str.startswith('tel:'):
+        return tel_str[4:]
+    return tel_str
 
 def owlthing_from_tel(tel_str, add_fr_prefix=True):
     """Construit un IRI valide à partir d'une chaîne de caractères représentant un numéro de téléphone.
@@ -474,25 +544,22 @@ def owlthing_from_tel(tel_str, add_fr_prefix=True):
     rdflib.term.URIRef('tel:+33-1-23-45-67-89')
     
     """
-    tel_str = re.sub('^tel[:]', '', tel_str)
-    red = re.sub(r'[.\s-]', '', tel_str)
-    tel = ''
+    if tel_str.startswith('tel:'):
+        tel_str = tel_str[4:]
+    red = _TEL_SEP_RE.sub('', tel_str)
 
-    if add_fr_prefix:
-        a = re.match(r'0(\d{9})$', red)
+    if add_fr_prefix and len(red) == 10 and red[0] == '0' \
+        and red[1:].isdecimal():
         # numéro français local
-        if a:
-            red = '+33' + a[1]
-    
-    if re.match(r'[+]33\d{9}$', red):
-        # numéro français global
-        for i in range(len(red)):
-            if i == 3 or i > 2 and i%2 == 0:
-                tel = tel + "-" + red[i]
-            else:
-                tel = tel + red[i]
+        red = '+33' + red[1:]
+    
+    if len(red) == 12 and red.startswith('+33') and red[3:].isdecimal():
+        # numéro français global, mis sous la forme
+        # +33-x-xx-xx-xx-xx
+        tel = '-'.join((red[:3], red[3], red[4:6], red[6:8],
+            red[8:10], red[10:]))
     else:
-        tel = re.sub(r'(\d)\s(\d)', r'\1-\2', tel_str).strip(' ')
+        tel = _DIGIT_SPACE_RE.sub(r'\1-\2', tel_str).strip(' ')
         # les espaces entre les chiffres sont remplacés par des tirets,
         # ceux en début et fin de chaine sont supprimés
         f = forbidden_char(tel)
@@ -501,7 +568,7 @@ def owlthing_from_tel(tel_str, add_fr_prefix=True):
                 "du numéro de téléphone '{}' n'est pas autorisé dans " \
                 'un IRI.'.format(f, tel_str))
     if tel:
-        return URIRef('tel:' + tel)
+        return uriref_from_str('tel:' + tel)
 
 def int_from_duration(duration):
     """Extrait un nombre entier et son unité d'un littéral représentant une durée.
@@ -703,6 +770,46 @@ def decimal_from_str(value):
         return
     return Literal(clean_value, datatype=XSD.decimal)
 
+def langstring_from_str(value, language):
+    """Renvoie la représentation RDF d'une chaîne de caractères dotée d'une langue.
+    
+    Parameters
+    ----------
+    value : str
+        La chaîne de caractères.
+    language : str
+        La langue de la chaîne, non vide.
+    
+    Returns
+    -------
+    rdflib.term.Literal
+        Un littéral de type ``rdf:langString``.
+    
+    Examples
+    --------
+    >>> langstring_from_str('Bonjour', 'fr')
+    rdflib.term.Literal('Bonjour', lang='fr')
+    
+    Notes
+    -----
+    Le résultat est identique à celui de ``Literal(value, lang=language)``,
+    mais, sauf à la première utilisation d'une langue, le littéral est
+    créé sans passer par le constructeur de RDFLib, dont les conversions
+    et contrôles sont sans objet pour une chaîne de caractères. La
+    langue est validée par le constructeur lors de sa première
+    utilisation.
+    
+    """
+    if not _FAST_LANGSTRING or not language in _checked_languages:
+        literal = Literal(value, lang=language)
+        _checked_languages.add(language)
+        return literal
+    literal = str.__new__(Literal, value)
+    literal._language = language
+    literal._datatype = None
+    literal._value = value
+    return literal
+
 def str_from_date(datelit):
     """Représentation d'une date sous forme de chaîne de caractères.
     
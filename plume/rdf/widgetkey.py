@@ -22,9 +22,15 @@ Les clés ne sont pas indépendantes les unes des autres. La
 création ou la modification d'une clé entraîne la modification
 (automatique) de son parent et parfois de ses soeurs.
 
+Les classes de clés ne sont pas conçues pour être dérivées.
+Plusieurs contrôles fréquemment exécutés reposent sur le type
+exact des clés (``type(key) is ValueKey``) plutôt que sur
+:py:func:`isinstance`, et ignoreraient des classes filles.
+
 """
 
 from uuid import uuid4
+from contextlib import contextmanager
 
 from plume.rdf.rdflib import URIRef, BNode, Literal
 from plume.rdf.exceptions import IntegrityBreach, MissingParameter, \
@@ -34,6 +40,33 @@ from plume.rdf.namespaces import DCAT, RDF, XSD, GSP
 from plume.rdf.metagraph import Metagraph
 from plume.rdf.utils import DatasetId, int_from_duration
 
+def _lazy_str(key, attribute):
+    """Renvoie la valeur d'un attribut d'une clé, sous forme de chaîne de caractères.
+    
+    Les valeurs de certains attributs (notamment des littéraux RDF)
+    sont stockées telles quelles à l'initialisation de la clé. Leur
+    conversion en chaîne de caractères est différée jusqu'à la
+    première lecture, et son résultat remplace alors la valeur brute.
+    
+    Parameters
+    ----------
+    key : WidgetKey
+        Une clé de dictionnaire de widgets.
+    attribute : str
+        Le nom de l'attribut.
+    
+    Returns
+    -------
+    str
+        La valeur de l'attribut, qui peut être ``None``.
+    
+    """
+    v = getattr(key, attribute)
+    if v is not None and type(v) is not str:
+        v = str(v)
+        setattr(key, attribute, v)
+    return v
+
 class WidgetKey:
     """Clé d'un dictionnaire de widgets.
     
@@ -75,6 +108,8 @@ class WidgetKey:
     * :py:class:`TranslationButtonKey` pour les boutons de traduction.
     
     """
+    __slots__ = ('_is_unborn', 'uuid', '_row', '_is_single_child',
+        '_is_ghost', '_parent', '_is_hidden_m', '_order_idx')
     
     langlist = ['fr', 'en']
     """list(str): Liste des langues autorisées.
@@ -178,7 +213,8 @@ class WidgetKey:
     Le carnet d'actions trace les actions à réaliser sur les widgets
     au fil des modifications des clés. Pour le réinitialiser, on
     utilisera la méthode de classe :py:meth:`clear_actionsbook`, et
-    :py:meth:`unload_actionsbook` pour le récupérer.
+    :py:meth:`unload_actionsbook` pour le récupérer. Le gestionnaire
+    de contexte :py:meth:`actions_scope` réalise ces deux opérations.
     
     Notes
     -----
@@ -186,6 +222,16 @@ class WidgetKey:
     
     """
     
+    EMPTY_ACTIONSBOOK = ActionsBook()
+    """plume.rdf.actionsbook.ActionsBook: Carnet d'actions vierge, renvoyé par les méthodes d'action lorsqu'elles sont sans effet.
+    
+    Warnings
+    --------
+    Ce carnet est partagé par toutes les instances de la classe. Il
+    ne doit sous aucun prétexte être modifié.
+    
+    """
+    
     no_computation = False
     """bool: Si True, empêche l'exécution immédiate de certaines opérations.
     
@@ -255,6 +301,11 @@ class WidgetKey:
         cls.clear_actionsbook()
         cls.no_computation = False
     
+    # carnet d'actions vierge, avec ses paramètres d'initialisation,
+    # qui n'a pas encore été renvoyé par unload_actionsbook et peut
+    # donc être réutilisé par clear_actionsbook
+    _blank_book = None
+    
     @classmethod
     def clear_actionsbook(cls, **kwargs):
         """Remplace le carnet d'actions par un carnet vierge.
@@ -265,8 +316,19 @@ class WidgetKey:
             Paramètres à passer à la fonction d'initialisation
             de la classe :py:class:`plume.rdf.actionsbook.ActionsBook`.
         
+        Notes
+        -----
+        Si le carnet courant est lui-même un carnet vierge créé avec
+        les mêmes paramètres et qui n'a pas encore été récupéré par
+        :py:meth:`unload_actionsbook`, il est conservé tel quel.
+        
         """
+        blank = cls._blank_book
+        if blank and blank[0] is cls.actionsbook and blank[1] == kwargs \
+            and not blank[0]:
+            return
         cls.actionsbook = ActionsBook(**kwargs)
+        cls._blank_book = (cls.actionsbook, kwargs)
     
     @classmethod
     def unload_actionsbook(cls, preserve_book=False):
@@ -285,10 +347,88 @@ class WidgetKey:
         
         """
         book = cls.actionsbook
+        cls._blank_book = None
         if not preserve_book:
             cls.clear_actionsbook()
         return book
     
+    @classmethod
+    @contextmanager
+    def actions_scope(cls, append_book=False, **kwargs):
+        """Gestionnaire de contexte qui délimite une action sur l'arbre de clés.
+        
+        À l'entrée, le carnet d'actions est réinitialisé. Le gestionnaire
+        de contexte renvoie le carnet qui trace les opérations réalisées
+        dans le contexte. À la sortie, ce carnet est récupéré avec
+        :py:meth:`unload_actionsbook`.
+        
+        Parameters
+        ----------
+        append_book : bool, default False
+            Si ``True``, le carnet d'actions n'est pas réinitialisé
+            à l'entrée, mais complété avec les nouvelles
+            opérations réalisées, et il n'est pas remplacé à la sortie.
+        **kwargs : dict, optional
+            Paramètres à passer à la fonction d'initialisation
+            de la classe :py:class:`plume.rdf.actionsbook.ActionsBook`
+            lors de la réinitialisation du carnet.
+        
+        Examples
+        --------
+        >>> with WidgetKey.actions_scope() as actionsbook:
+        ...     widgetkey.kill()
+        >>> actionsbook.drop
+        [...]
+        
+        """
+        if not append_book:
+            cls.clear_actionsbook(**kwargs)
+        book = cls.actionsbook
+        try:
+            yield book
+        finally:
+            cls.unload_actionsbook(preserve_book=append_book)
+    
+    # profondeur d'imbrication des contextes bulk_update, et
+    # groupes dont le calcul des lignes et des filles uniques a
+    # été différé (dictionnaire utilisé comme ensemble ordonné)
+    _bulk_depth = 0
+    _pending_groups = {}
+    
+    @classmethod
+    @contextmanager
+    def bulk_update(cls):
+        """Gestionnaire de contexte qui diffère le calcul des lignes et des filles uniques.
+        
+        Dans le contexte, l'ajout ou la suppression d'une clé
+        ne déclenche plus immédiatement :py:meth:`GroupKey.compute_rows`
+        et :py:meth:`GroupKey.compute_single_children` sur le groupe
+        parent. Ces calculs sont réalisés une seule fois par groupe
+        concerné à la sortie du contexte le plus externe.
+        
+        Examples
+        --------
+        >>> with WidgetKey.bulk_update():
+        ...     groupkey.copy(empty=False)
+        
+        Notes
+        -----
+        Les contextes peuvent être imbriqués.
+        
+        """
+        WidgetKey._bulk_depth += 1
+        try:
+            yield
+        finally:
+            WidgetKey._bulk_depth -= 1
+            if not WidgetKey._bulk_depth:
+                groups = list(WidgetKey._pending_groups)
+                WidgetKey._pending_groups = {}
+                for group in groups:
+                    if group._is_attached():
+                        group.compute_rows()
+                        group.compute_single_children()
+    
     @property
     def main_language(self):
         """Langue principale de saisie des métadonnées.
@@ -342,7 +482,7 @@ class WidgetKey:
             WidgetKey.langlist.sort(key= lambda x: (x != value, x))
 
     def __new__(cls, **kwargs):
-        if cls.__name__ == 'WidgetKey':
+        if cls is WidgetKey:
             raise ForbiddenOperation('La classe `WidgetKey` ne ' \
                 'devrait pas être directement utilisée pour créer ' \
                 'de nouvelles clés.')
@@ -362,8 +502,7 @@ class WidgetKey:
         self._computed_attributes(**kwargs)
         self.order_idx = kwargs.get('order_idx')
         if self and self.parent and not WidgetKey.no_computation:
-            self.parent.compute_rows()
-            self.parent.compute_single_children()
+            self.parent._compute_or_defer()
         self._is_unborn = False
         WidgetKey.actionsbook.create.append(self)
 
@@ -548,8 +687,14 @@ class WidgetKey:
         -----
         Cette propriété est en lecture seule.
         
+        Le masquage d'une branche étant propagé à tous ses descendants
+        par :py:meth:`WidgetKey._hide_m`, il n'est jamais nécessaire de
+        remonter l'arbre pour l'évaluer : les attributs de la clé
+        sont lus directement, sans passer par les propriétés
+        :py:attr:`is_ghost` et :py:attr:`is_hidden_m`.
+        
         """
-        return not self or self.is_hidden_b or self.is_hidden_m
+        return self._is_ghost or self._is_hidden_m or self.is_hidden_b
 
     @property
     def has_minus_button(self):
@@ -1001,10 +1146,9 @@ class WidgetKey:
         if not self.has_label:
             return
         row, column, rowspan, columnspan = self.placement
-        row = ( row - 1 ) if self.independant_label else row
-        if not self.independant_label:
-            columnspan = WidgetKey.width('label')
-        return (row, 0, 1, columnspan)
+        if self.independant_label:
+            return (row - 1, 0, 1, columnspan)
+        return (row, 0, 1, WidgetKey.width('label'))
 
     @property
     def is_single_child(self):
@@ -1061,31 +1205,58 @@ class WidgetKey:
         l.append(self.parent.children.index(self))
         return tuple(l)
 
-    @property
-    def attr_to_copy(self):
-        """dict: Attributs de la classe à prendre en compte pour la copie des clés.
-        
-        Cette propriété est un dictionnaire dont les clés sont les
-        noms des attributs contenant les informations nécessaires pour
-        dupliquer la clé, et les valeurs sont des booléens qui indiquent
-        si l'attribut est à prendre en compte lorsqu'il s'agit de
-        créer une copie vide de la clé.
+    attr_to_copy = (('order_idx', True), ('parent', True))
+    """tuple(tuple(str, bool)): Attributs de la classe à prendre en compte pour la copie des clés.
+    
+    Cet attribut est un tuple de couples dont le premier élément
+    est le nom d'un attribut contenant des informations nécessaires
+    pour dupliquer la clé, et le second un booléen qui indique
+    si l'attribut est à prendre en compte lorsqu'il s'agit de
+    créer une copie vide de la clé.
+    
+    Certains attributs sont volontairement exclus de cette liste, car
+    ils requièrent un traitement spécifique.
+    
+    See Also
+    --------
+    WidgetKey.copy
+    
+    Notes
+    -----
+    Plusieurs classes filles de :py:class:`WidgetKey` redéfinissent
+    cet attribut, en complétant le tuple avec leurs propres
+    attributs.
+    
+    """
+
+    # mémorise, pour chaque couple (classe, empty), le tuple des
+    # noms d'attributs à copier, déduit de attr_to_copy
+    _attr_names_cache = {}
+
+    def _attr_names_to_copy(self, empty=True):
+        """Renvoie les noms des attributs à prendre en compte pour la copie de la clé.
         
-        Certains attributs sont volontairement exclus de cette liste, car
-        ils requièrent un traitement spécifique.
+        Le résultat, qui ne dépend que de la classe de la clé et de
+        `empty`, est calculé une seule fois à partir de
+        :py:attr:`WidgetKey.attr_to_copy`, puis mémorisé.
         
-        See Also
-        --------
-        WidgetKey.copy
+        Parameters
+        ----------
+        empty : bool, default True
+            S'agit-il d'une copie vide ?
         
-        Notes
-        -----
-        Plusieurs classes filles de :py:class:`WidgetKey` redéfinissent
-        cette propriété, en complétant le dictionnaire avec leurs propres
-        attributs.
+        Returns
+        -------
+        tuple(str)
         
         """
-        return { 'order_idx': True, 'parent': True }
+        k = (type(self), bool(empty))
+        names = WidgetKey._attr_names_cache.get(k)
+        if names is None:
+            names = tuple(a for a, keep in self.attr_to_copy
+                if keep or not empty)
+            WidgetKey._attr_names_cache[k] = names
+        return names
 
     def copy(self, parent=None, empty=True):
         """Renvoie une copie de la clé.
@@ -1130,12 +1301,10 @@ class WidgetKey:
         return self._copy(parent=parent, empty=empty)
 
     def _copy(self, parent=None, empty=True):
-        d = self.attr_to_copy
-        kwargs = { k: getattr(self, k) for k in d.keys() \
-            if not empty or d[k] }
+        kwargs = { k: getattr(self, k) for k in self._attr_names_to_copy(empty) }
         if parent:
            kwargs['parent'] = parent
-        return type(self).__call__(**kwargs)
+        return type(self)(**kwargs)
 
     def kill(self):
         """Efface une clé de la mémoire de son parent.
@@ -1156,17 +1325,15 @@ class WidgetKey:
         if isinstance(self, GroupKey):
             self._notify_dead_children()
 
-    @property
-    def attr_to_update(self):
-        """list(str): Liste des attributs et propriétés pouvant être redéfinis post initialisation.
-        
-        Notes
-        -----
-        Plusieurs des classes filles de :py:class:`WidgetKey` redéfinissent
-        cette propriété en ajoutant ou retirant des attributs à la liste.
-        
-        """
-        return ['order_idx']
+    attr_to_update = frozenset(('order_idx',))
+    """frozenset(str): Ensemble des attributs et propriétés pouvant être redéfinis post initialisation.
+    
+    Notes
+    -----
+    Plusieurs des classes filles de :py:class:`WidgetKey` redéfinissent
+    cet attribut en ajoutant ou retirant des attributs à l'ensemble.
+    
+    """
 
     def update(self, exclude_none=False, **kwargs):
         """Met à jour les attributs de la clé selon les valeurs fournies.
@@ -1250,9 +1417,14 @@ class ObjectKey(WidgetKey):
       du triplet RDF est un IRI ou une valeur litérale.
     
     """
+    # pas d'attributs déclarés ici, pour que GroupOfPropertiesKey puisse
+    # hériter à la fois de GroupKey et ObjectKey. Les attributs
+    # initialisés par ObjectKey._base_attributes sont déclarés
+    # par les classes filles.
+    __slots__ = ()
     
     def __new__(cls, **kwargs):
-        if cls.__name__ == 'ObjectKey':
+        if cls is ObjectKey:
             raise ForbiddenOperation('La classe `ObjectKey` ne ' \
                 'devrait pas être directement utilisée pour créer ' \
                 'de nouvelles clés.')
@@ -1264,6 +1436,7 @@ class ObjectKey(WidgetKey):
         self._description = None
         self._m_twin = None
         self._is_main_twin = None
+        self._twin_skip_hide = False
     
     def _computed_attributes(self, **kwargs):
         self.m_twin = kwargs.get('m_twin')
@@ -1530,6 +1703,7 @@ class ObjectKey(WidgetKey):
         self._m_twin = value
         if value:
             value._m_twin = self
+        self._refresh_twin_flags()
         if not self._is_unborn:
             # pour une clé dont le jumeau est défini a posteriori,
             # il faut s'assurer de la cohérence des attributs partagés
@@ -1612,58 +1786,67 @@ class ObjectKey(WidgetKey):
     def is_main_twin(self, value):
         if not self.m_twin:
             self._is_main_twin = False
-            return
-        if not self.is_hidden_m:
+        elif not self.is_hidden_m:
             self._is_main_twin = True
             self.m_twin._is_main_twin = False
-            return
-        if not self.m_twin.is_hidden_m:
+        elif not self.m_twin.is_hidden_m:
             self._is_main_twin = False
             self.m_twin._is_main_twin = True
-            return
-        # reste le cas où les deux jumelles sont masquées,
-        # ce qui n'est supposé arriver que dans une branche
-        # masquée.
-        if value is None:
-            value = isinstance(self, ValueKey)
-        self._is_main_twin = value
-        self.m_twin._is_main_twin = not value   
-
-    @property
-    def attr_to_update(self):
-        """list(str): Liste des attributs et propriétés pouvant être redéfinis post initialisation.
-        
-        Notes
-        -----
-        Réécriture de la propriété :py:attr:`WidgetKey.attr_to_update`.
-        
-        """
-        return ['order_idx', 'predicate', 'label', 'description', 'is_hidden_m']
+        else:
+            # reste le cas où les deux jumelles sont masquées,
+            # ce qui n'est supposé arriver que dans une branche
+            # masquée.
+            if value is None:
+                value = isinstance(self, ValueKey)
+            self._is_main_twin = value
+            self.m_twin._is_main_twin = not value
+        self._refresh_twin_flags()
+
+    def _refresh_twin_flags(self):
+        # tient à jour l'attribut _twin_skip_hide de la clé et
+        # de sa jumelle, qui vaut True pour une clé ayant une
+        # jumelle sans être la jumelle principale. Cette méthode
+        # doit être appelée à chaque modification de _m_twin ou
+        # _is_main_twin. NB : une clé jumelle n'est jamais un
+        # fantôme, il suffit donc de tester l'existence de la
+        # jumelle.
+        twin = self._m_twin
+        self._twin_skip_hide = twin is not None and not self._is_main_twin
+        if twin is not None:
+            twin._twin_skip_hide = not twin._is_main_twin
+
+    attr_to_update = frozenset(('order_idx', 'predicate', 'label',
+        'description', 'is_hidden_m'))
+    """frozenset(str): Ensemble des attributs et propriétés pouvant être redéfinis post initialisation.
+    
+    Notes
+    -----
+    Réécriture de l'attribut :py:attr:`WidgetKey.attr_to_update`.
+    
+    """
 
-    @property
-    def attr_to_copy(self):
-        """dict: Attributs de la classe à prendre en compte pour la copie des clés.
-        
-        Cette propriété est un dictionnaire dont les clés sont les
-        noms des attributs contenant les informations nécessaires pour
-        dupliquer la clé, et les valeurs sont des booléens qui indiquent
-        si l'attribut est à prendre en compte lorsqu'il s'agit de
-        créer une copie vide de la clé.
-        
-        Certains attributs sont volontairement exclus de cette liste, car
-        ils requièrent un traitement spécifique.
-        
-        See Also
-        --------
-        WidgetKey.copy
-        
-        Notes
-        -----
-        Réécriture de la propriété :py:attr:`WidgetKey.attr_to_copy`.
-        
-        """
-        return { 'order_idx': True, 'parent': True, 'predicate': True,
-            'label': True, 'description': True }
+    attr_to_copy = (('order_idx', True), ('parent', True), ('predicate', True),
+        ('label', True), ('description', True))
+    """tuple(tuple(str, bool)): Attributs de la classe à prendre en compte pour la copie des clés.
+    
+    Cet attribut est un tuple de couples dont le premier élément
+    est le nom d'un attribut contenant des informations nécessaires
+    pour dupliquer la clé, et le second un booléen qui indique
+    si l'attribut est à prendre en compte lorsqu'il s'agit de
+    créer une copie vide de la clé.
+    
+    Certains attributs sont volontairement exclus de cette liste, car
+    ils requièrent un traitement spécifique.
+    
+    See Also
+    --------
+    WidgetKey.copy
+    
+    Notes
+    -----
+    Réécriture de l'attribut :py:attr:`WidgetKey.attr_to_copy`.
+    
+    """
 
     def kill(self, preserve_twin=False):
         """Efface une clé de la mémoire de son parent.
@@ -1715,11 +1898,10 @@ class ObjectKey(WidgetKey):
         
         """
         if not self.has_minus_button:
-            return ActionsBook()
-        if not append_book:
-            WidgetKey.clear_actionsbook()
-        self.kill()
-        return WidgetKey.unload_actionsbook(preserve_book=append_book)
+            return WidgetKey.EMPTY_ACTIONSBOOK
+        with WidgetKey.actions_scope(append_book) as book:
+            self.kill()
+        return book
 
     def switch_twin(self, value_source=None, append_book=False):
         """Intervertit la visibilité d'un couple de jumelles.
@@ -1747,13 +1929,12 @@ class ObjectKey(WidgetKey):
         
         """
         if self.is_hidden:
-            return ActionsBook()
-        if not append_book:
-            WidgetKey.clear_actionsbook()
-        self.is_hidden_m = True
-        if isinstance(self.m_twin, ValueKey) and value_source:
-            self.m_twin.value_source = value_source
-        return WidgetKey.unload_actionsbook(preserve_book=append_book)
+            return WidgetKey.EMPTY_ACTIONSBOOK
+        with WidgetKey.actions_scope(append_book) as book:
+            self.is_hidden_m = True
+            if isinstance(self.m_twin, ValueKey) and value_source:
+                self.m_twin.value_source = value_source
+        return book
 
 class GroupKey(WidgetKey):
     """Clé de groupe.
@@ -1797,8 +1978,10 @@ class GroupKey(WidgetKey):
     * :py:class:`TabKey` pour les onglets.
     
     """
+    __slots__ = ('children',)
+
     def __new__(cls, **kwargs):
-        if cls.__name__ == 'GroupKey':
+        if cls is GroupKey:
             raise ForbiddenOperation('La classe `GroupKey` ne ' \
                 'devrait pas être directement utilisée pour créer ' \
                 'de nouvelles clés.')
@@ -1807,6 +1990,66 @@ class GroupKey(WidgetKey):
     def _base_attributes(self, **kwargs):
         self.children = ChildrenList()
     
+    def _child_added(self, child):
+        """Opérations complémentaires à l'ajout d'une clé fille.
+        
+        Cette méthode est appelée par :py:meth:`ChildrenList.append`.
+        Elle est sans effet sur la classe :py:class:`GroupKey`, mais
+        est redéfinie par :py:class:`TranslationGroupKey`.
+        
+        Parameters
+        ----------
+        child : WidgetKey
+            La clé fille ajoutée.
+        
+        """
+        return
+    
+    def _child_removed(self, child):
+        """Opérations complémentaires à la suppression d'une clé fille.
+        
+        Cette méthode est appelée par :py:meth:`ChildrenList.remove`.
+        Elle est sans effet sur la classe :py:class:`GroupKey`, mais
+        est redéfinie par :py:class:`TranslationGroupKey`.
+        
+        Parameters
+        ----------
+        child : WidgetKey
+            La clé fille supprimée.
+        
+        """
+        return
+    
+    def _compute_or_defer(self):
+        """Calcule les lignes et les filles uniques du groupe, ou diffère ce calcul.
+        
+        Le calcul est différé quand la méthode est appelée dans
+        le contexte de :py:meth:`WidgetKey.bulk_update`.
+        
+        """
+        if WidgetKey._bulk_depth:
+            WidgetKey._pending_groups[self] = True
+        else:
+            self.compute_rows()
+            self.compute_single_children()
+    
+    def _is_attached(self):
+        """La clé appartient-elle toujours à un arbre ?
+        
+        Returns
+        -------
+        bool
+            ``False`` si la clé ou l'un de ses ancêtres a été
+            retiré de la liste des filles de son parent.
+        
+        """
+        key = self
+        while not isinstance(key, RootKey):
+            if not key in key.parent.children:
+                return False
+            key = key.parent
+        return True
+    
     def _hide_m(self, value, rec=False):
         super()._hide_m(value, rec=rec)
         for child in self.real_children():
@@ -1849,6 +2092,24 @@ class GroupKey(WidgetKey):
             if child:
                 yield child
     
+    def first_real_child(self):
+        """Renvoie la première clé fille qui n'est pas un fantôme.
+        
+        Returns
+        -------
+        ValueKey or GroupKey or None
+            ``None`` si le groupe ne contient que des fantômes,
+            ou aucune clé.
+        
+        See Also
+        --------
+        GroupKey.real_children
+        
+        """
+        for child in self.children:
+            if not child._is_ghost:
+                return child
+    
     def compute_single_children(self):
         return
     
@@ -1936,6 +2197,9 @@ class GroupKey(WidgetKey):
                 return child._search_from_uuid(uuid)
 
     def _clean(self):
+        # les conditions sont réévaluées au fil du parcours : la
+        # suppression d'une clé peut modifier sa jumelle (qui n'est
+        # alors plus une jumelle) et les filles réelles de son parent
         if isinstance(self, GroupOfPropertiesKey) and self.m_twin \
             and not self.is_main_twin and not self.has_source_button:
             self.kill(preserve_twin=True)
@@ -1991,13 +2255,14 @@ class GroupKey(WidgetKey):
         copie des filles de la clé.
         
         """
-        key = super().copy(parent=parent, empty=empty)
-        for child in self.real_children():
-            child.copy(parent=key, empty=empty)
-            if empty and isinstance(self, GroupOfValuesKey):
-                # dans un groupe de valeurs ou de traduction,
-                # seule la première fille est copiée
-                break
+        with WidgetKey.bulk_update():
+            key = super().copy(parent=parent, empty=empty)
+            for child in self.real_children():
+                child.copy(parent=key, empty=empty)
+                if empty and isinstance(self, GroupOfValuesKey):
+                    # dans un groupe de valeurs ou de traduction,
+                    # seule la première fille est copiée
+                    break
         return key
 
     def search_tab(self, label=None):
@@ -2078,6 +2343,7 @@ class TabKey(GroupKey):
     condition.
     
     """
+    __slots__ = ('_label',)
     
     def _base_attributes(self, **kwargs):
         super()._base_attributes(**kwargs)
@@ -2091,12 +2357,10 @@ class TabKey(GroupKey):
         return isinstance(parent, GroupOfPropertiesKey) \
             or isinstance(parent, RootKey)
     
-    @property
-    def key_object(self):
-        """str: Transcription littérale du type de clé.
-        
-        """
-        return 'tab'
+    key_object = 'tab'
+    """str: Transcription littérale du type de clé.
+    
+    """
 
     @property
     def node(self):
@@ -2167,26 +2431,21 @@ class TabKey(GroupKey):
             and not self.has_real_children:
             self._is_ghost = True
             if not WidgetKey.no_computation:
-                # NB: on n'exécute pas compute_single_children,
-                # car le parent ne peut pas être un groupe
-                # de valeurs.
-                self.parent.compute_rows()
+                self.parent._compute_or_defer()
             WidgetKey.actionsbook.drop.append(self) 
 
     @property
     def placement(self):
         return
 
-    @property
-    def attr_to_update(self):
-        """list(str): Liste des attributs et propriétés pouvant être redéfinis post initialisation.
-        
-        Notes
-        -----
-        Réécriture de la propriété :py:attr:`WidgetKey.attr_to_update`.
-        
-        """
-        return ['order_idx', 'label']
+    attr_to_update = frozenset(('order_idx', 'label'))
+    """frozenset(str): Ensemble des attributs et propriétés pouvant être redéfinis post initialisation.
+    
+    Notes
+    -----
+    Réécriture de l'attribut :py:attr:`WidgetKey.attr_to_update`.
+    
+    """
 
 class GroupOfPropertiesKey(GroupKey, ObjectKey):
     """Groupe de propriétés.
@@ -2243,6 +2502,8 @@ class GroupOfPropertiesKey(GroupKey, ObjectKey):
         c'est lui qui porte cette information. Sinon, elle est obligatoire.
     
     """
+    __slots__ = ('_predicate', '_label', '_description', '_m_twin',
+        '_is_main_twin', '_twin_skip_hide', '_rdfclass', '_node')
     
     def _base_attributes(self, **kwargs):
         GroupKey._base_attributes(self, **kwargs)
@@ -2262,12 +2523,10 @@ class GroupOfPropertiesKey(GroupKey, ObjectKey):
         return isinstance(parent, GroupKey) and \
             not isinstance(parent, TranslationGroupKey)
  
-    @property
-    def key_object(self):
-        """str: Transcription littérale du type de clé.
-        
-        """
-        return 'group of properties'
+    key_object = 'group of properties'
+    """str: Transcription littérale du type de clé.
+    
+    """
  
     @property
     def node(self):
@@ -2353,7 +2612,7 @@ class GroupOfPropertiesKey(GroupKey, ObjectKey):
         Réécriture de la propriété :py:attr:`WidgetKey.has_source_button`.
         
         """
-        return self and WidgetKey.with_source_buttons and bool(self.m_twin)
+        return WidgetKey.with_source_buttons and self and bool(self.m_twin)
 
     @property
     def is_ghost(self):
@@ -2383,51 +2642,46 @@ class GroupOfPropertiesKey(GroupKey, ObjectKey):
             and not self.has_real_children:
             self._is_ghost = True
             if not WidgetKey.no_computation:
-                self.parent.compute_rows()
-                self.parent.compute_single_children()
+                self.parent._compute_or_defer()
             WidgetKey.actionsbook.drop.append(self) 
 
     def _hide_m(self, value, rec=False):
-        if rec and value and self.m_twin and not self.is_main_twin:
+        if rec and value and self._twin_skip_hide:
             return
         super()._hide_m(value, rec=rec)
 
-    @property
-    def attr_to_update(self):
-        """list(str) : Liste des attributs et propriétés pouvant être redéfinis post initialisation.
-        
-        Notes
-        -----
-        Réécriture de la propriété :py:attr:`WidgetKey.attr_to_update`.
-        
-        """
-        return ['order_idx', 'predicate', 'label', 'description', 'is_hidden_m',
-            'node', 'rdfclass']
+    attr_to_update = frozenset(('order_idx', 'predicate', 'label',
+        'description', 'is_hidden_m', 'node', 'rdfclass'))
+    """frozenset(str): Ensemble des attributs et propriétés pouvant être redéfinis post initialisation.
+    
+    Notes
+    -----
+    Réécriture de l'attribut :py:attr:`WidgetKey.attr_to_update`.
+    
+    """
 
-    @property
-    def attr_to_copy(self):
-        """dict: Attributs de la classe à prendre en compte pour la copie des clés.
-        
-        Cette propriété est un dictionnaire dont les clés sont les
-        noms des attributs contenant les informations nécessaires pour
-        dupliquer la clé, et les valeurs sont des booléens qui indiquent
-        si l'attribut est à prendre en compte lorsqu'il s'agit de
-        créer une copie vide de la clé.
-        
-        Certains attributs sont volontairement exclus de cette liste, car
-        ils requièrent un traitement spécifique.
-        
-        See Also
-        --------
-        WidgetKey.copy, GroupKey.copy
-        
-        Notes
-        -----
-        Réécriture de la propriété :py:attr:`WidgetKey.attr_to_copy`.
-        
-        """
-        return { 'order_idx': True, 'parent': True, 'predicate': True,
-            'label': True, 'description': True, 'rdfclass': True }
+    attr_to_copy = (('order_idx', True), ('parent', True), ('predicate', True),
+        ('label', True), ('description', True), ('rdfclass', True))
+    """tuple(tuple(str, bool)): Attributs de la classe à prendre en compte pour la copie des clés.
+    
+    Cet attribut est un tuple de couples dont le premier élément
+    est le nom d'un attribut contenant des informations nécessaires
+    pour dupliquer la clé, et le second un booléen qui indique
+    si l'attribut est à prendre en compte lorsqu'il s'agit de
+    créer une copie vide de la clé.
+    
+    Certains attributs sont volontairement exclus de cette liste, car
+    ils requièrent un traitement spécifique.
+    
+    See Also
+    --------
+    WidgetKey.copy, GroupKey.copy
+    
+    Notes
+    -----
+    Réécriture de l'attribut :py:attr:`WidgetKey.attr_to_copy`.
+    
+    """
 
     def copy(self, parent=None, empty=True):
         """Renvoie une copie de la clé.
@@ -2459,12 +2713,13 @@ class GroupOfPropertiesKey(GroupKey, ObjectKey):
             des fantômes, ceux-ci ne seront simplement pas copiés.
         
         """
-        key = GroupKey.copy(self, parent=parent, empty=empty)
-        if self.m_twin:
-            parent = key.parent
-            twin_key = self.m_twin._copy(parent=parent, empty=empty)
-            key.m_twin = twin_key
-            key.is_hidden_m = self.is_hidden_m
+        with WidgetKey.bulk_update():
+            key = GroupKey.copy(self, parent=parent, empty=empty)
+            if self.m_twin:
+                parent = key.parent
+                twin_key = self.m_twin._copy(parent=parent, empty=empty)
+                key.m_twin = twin_key
+                key.is_hidden_m = self.is_hidden_m
         return key
 
     def paste_from_rdfclass(self, widgetkey):
@@ -2493,7 +2748,7 @@ class GroupOfPropertiesKey(GroupKey, ObjectKey):
         
         """
         if self.is_hidden:
-            return ActionsBook()
+            return WidgetKey.EMPTY_ACTIONSBOOK
         if widgetkey.is_hidden:
             raise ForbiddenOperation("Il n'est pas permis de " \
                 'copier/coller une branche fantôme ou masquée.', self)
@@ -2503,14 +2758,14 @@ class GroupOfPropertiesKey(GroupKey, ObjectKey):
         if not self.rdfclass == widgetkey.rdfclass:
             raise ForbiddenOperation('`rdfclass` doit être ' \
                 'identique pour les deux clés.', self)
-        WidgetKey.clear_actionsbook()
-        self.kill()
-        newkey = widgetkey.copy(parent=self.parent, empty=False)
-        newkey.update(predicate=self.predicate, label=self.label,
-            description=self.description, order_idx=self.order_idx)
-            # les informations relatives au prédicat du groupe
-            # sont conservées
-        return WidgetKey.unload_actionsbook()
+        with WidgetKey.actions_scope() as book:
+            self.kill()
+            newkey = widgetkey.copy(parent=self.parent, empty=False)
+            newkey.update(predicate=self.predicate, label=self.label,
+                description=self.description, order_idx=self.order_idx)
+                # les informations relatives au prédicat du groupe
+                # sont conservées
+        return book
 
     def kill(self, **kwargs):
         """Efface une clé de la mémoire de son parent.
@@ -2619,6 +2874,12 @@ class GroupOfValuesKey(GroupKey):
         Référence la clé qui représente le bouton plus du groupe.
     
     """
+    __slots__ = ('button', '_with_minus_buttons', '_predicate', '_label',
+        '_description', '_rdfclass', '_sources', '_sources_set', '_datatype',
+        '_transform', '_placeholder', '_input_mask', '_is_mandatory',
+        '_is_read_only', '_regex_validator', '_regex_validator_flags',
+        '_geo_tools', '_compute')
+
     def _base_attributes(self, **kwargs):
         super()._base_attributes(**kwargs)
         self.button = None
@@ -2628,6 +2889,7 @@ class GroupOfValuesKey(GroupKey):
         self._description = None
         self._rdfclass = None
         self._sources = None
+        self._sources_set = None
         self._datatype = None
         self._transform = None
         self._placeholder = None
@@ -2645,10 +2907,11 @@ class GroupOfValuesKey(GroupKey):
         self.predicate = kwargs.get('predicate')
         self.label = kwargs.get('label')
         self.description = kwargs.get('description')
-        self.rdfclass = kwargs.get('rdfclass')
-        self.sources = kwargs.get('sources')
-        self.datatype = kwargs.get('datatype')
-        self.transform = kwargs.get('transform')
+        if not isinstance(self, TranslationGroupKey):
+            self.rdfclass = kwargs.get('rdfclass')
+            self.sources = kwargs.get('sources')
+            self.transform = kwargs.get('transform')
+        self._set_raw_datatype(kwargs.get('datatype'))
         self.placeholder = kwargs.get('placeholder')
         self.input_mask = kwargs.get('input_mask')
         self.is_mandatory = kwargs.get('is_mandatory')
@@ -2661,12 +2924,10 @@ class GroupOfValuesKey(GroupKey):
     def _validate_parent(self, parent):
         return isinstance(parent, (GroupOfPropertiesKey, TabKey, RootKey))
     
-    @property
-    def key_object(self):
-        """str: Transcription littérale du type de clé.
-        
-        """
-        return 'group of values'
+    key_object = 'group of values'
+    """str: Transcription littérale du type de clé.
+    
+    """
     
     @property
     def is_ghost(self):
@@ -2698,8 +2959,7 @@ class GroupOfValuesKey(GroupKey):
             self._is_ghost = True
             self.with_minus_buttons = self.with_minus_buttons
             if not WidgetKey.no_computation:
-                self.parent.compute_rows()
-                self.parent.compute_single_children()
+                self.parent._compute_or_defer()
             WidgetKey.actionsbook.drop.append(self) 
     
     @property
@@ -2853,6 +3113,7 @@ class GroupOfValuesKey(GroupKey):
     def sources(self, value):
         if value != self.sources:
             self._sources = value
+            self._sources_set = frozenset(value) if value else None
             if not self._is_unborn:
                 for child in self.children:
                     if isinstance(child, ValueKey) and child.value_source:
@@ -2891,6 +3152,29 @@ class GroupOfValuesKey(GroupKey):
     
     @datatype.setter
     def datatype(self, value):
+        self._set_raw_datatype(value)
+        self.geo_tools = self._geo_tools
+        # on réinitialise bien avec _geo_tools
+        # et pas geo_tools, car le second tronque
+        # la liste si la clé est en lecture seule
+        for child in self.children:
+            if isinstance(child, ValueKey):
+                child.value_language = child.value_language
+                child.is_long_text = child.is_long_text
+                child.value_unit = child.value_unit
+
+    def _set_raw_datatype(self, value):
+        """Définit le type de valeur du groupe sans mise en cohérence des propriétés dépendantes.
+
+        Utilisée à l'initialisation de la clé, lorsque les
+        propriétés dépendantes n'ont pas encore été définies.
+
+        Parameters
+        ----------
+        value : rdflib.term.URIRef
+            Le type de valeur.
+
+        """
         tlist = [XSD.string, XSD.integer, XSD.decimal,
             XSD.boolean, XSD.date, XSD.time, XSD.dateTime,
             XSD.duration, GSP.wktLiteral, RDF.langString]
@@ -2899,17 +3183,7 @@ class GroupOfValuesKey(GroupKey):
         elif not value in tlist:
             value = XSD.string
         self._datatype = value
-        if not self._is_unborn:
-            self.geo_tools = self._geo_tools
-            # on réinitialise bien avec _geo_tools
-            # et pas geo_tools, car le second tronque
-            # la liste si la clé est en lecture seule
-            for child in self.children:
-                if isinstance(child, ValueKey):
-                    child.value_language = child.value_language
-                    child.is_long_text = child.is_long_text
-                    child.value_unit = child.value_unit
-    
+
     @property
     def transform(self):
         """{None, 'email', 'phone'}: Nature de la transformation appliquée aux clés-valeurs du groupe.
@@ -2950,11 +3224,11 @@ class GroupOfValuesKey(GroupKey):
         propriétés, mais cela ne présente aucun intérêt.
         
         """
-        return self._placeholder
+        return _lazy_str(self, '_placeholder')
 
     @placeholder.setter
     def placeholder(self, value):
-        self._placeholder = str(value) if value else None
+        self._placeholder = value or None
     
     @property
     def input_mask(self):
@@ -2970,11 +3244,11 @@ class GroupOfValuesKey(GroupKey):
         propriétés, mais cela ne présente aucun intérêt.
         
         """
-        return self._input_mask
+        return _lazy_str(self, '_input_mask')
 
     @input_mask.setter
     def input_mask(self, value):
-        self._input_mask = str(value) if value else None
+        self._input_mask = value or None
     
     @property
     def is_mandatory(self):
@@ -2994,7 +3268,7 @@ class GroupOfValuesKey(GroupKey):
 
     @is_mandatory.setter
     def is_mandatory(self, value):
-        self._is_mandatory = bool(value)
+        self._is_mandatory = True if value else False
     
     @property
     def is_read_only(self):
@@ -3014,7 +3288,7 @@ class GroupOfValuesKey(GroupKey):
 
     @is_read_only.setter
     def is_read_only(self, value):
-        self._is_read_only = bool(value)
+        self._is_read_only = True if value else False
     
     @property
     def regex_validator(self):
@@ -3033,11 +3307,11 @@ class GroupOfValuesKey(GroupKey):
         :py:attr:`GroupOfValuesKey.regex_validator_flags`.
         
         """
-        return self._regex_validator
+        return _lazy_str(self, '_regex_validator')
 
     @regex_validator.setter
     def regex_validator(self, value):
-        self._regex_validator = str(value) if value else None
+        self._regex_validator = value or None
         if not self._is_unborn:
             self.regex_validator_flags = self.regex_validator_flags
     
@@ -3059,13 +3333,13 @@ class GroupOfValuesKey(GroupKey):
         propriétés, mais cela ne présente aucun intérêt.
         
         """
-        return self._regex_validator_flags
+        return _lazy_str(self, '_regex_validator_flags')
 
     @regex_validator_flags.setter
     def regex_validator_flags(self, value):
         if not self.regex_validator:
             value = None
-        self._regex_validator_flags = str(value) if value else None
+        self._regex_validator_flags = value or None
 
     @property
     def geo_tools(self):
@@ -3127,7 +3401,7 @@ class GroupOfValuesKey(GroupKey):
         celle-ci porte bien sur le groupe de valeurs.
         
         """
-        return self and WidgetKey.with_compute_buttons \
+        return WidgetKey.with_compute_buttons and self \
             and bool(self.compute) and 'manual' in self.compute \
             and not self.is_read_only
     
@@ -3164,49 +3438,46 @@ class GroupOfValuesKey(GroupKey):
         if self.button and str(self.button.uuid) == str(uuid):
             return self.button
 
-    @property
-    def attr_to_update(self):
-        """list(str): Liste des attributs et propriétés pouvant être redéfinis post initialisation.
-        
-        Notes
-        -----
-        Réécriture de la propriété :py:attr:`WidgetKey.attr_to_update`.
-        
-        """
-        return ['order_idx', 'predicate', 'label', 'description', 'rdfclass',
-            'sources', 'datatype', 'transform', 'placeholder', 'input_mask',
-            'is_mandatory', 'is_read_only', 'regex_validator',
-            'regex_validator_flags', 'with_minus_buttons', 'geo_tools',
-            'compute']
+    attr_to_update = frozenset(('order_idx', 'predicate', 'label',
+        'description', 'rdfclass', 'sources', 'datatype', 'transform',
+        'placeholder', 'input_mask', 'is_mandatory', 'is_read_only',
+        'regex_validator', 'regex_validator_flags', 'with_minus_buttons',
+        'geo_tools', 'compute'))
+    """frozenset(str): Ensemble des attributs et propriétés pouvant être redéfinis post initialisation.
+    
+    Notes
+    -----
+    Réécriture de l'attribut :py:attr:`WidgetKey.attr_to_update`.
+    
+    """
 
-    @property
-    def attr_to_copy(self):
-        """dict: Attributs de la classe à prendre en compte pour la copie des clés.
-        
-        Cette propriété est un dictionnaire dont les clés sont les
-        noms des attributs contenant les informations nécessaires pour
-        dupliquer la clé, et les valeurs sont des booléens qui indiquent
-        si l'attribut est à prendre en compte lorsqu'il s'agit de
-        créer une copie vide de la clé.
-        
-        Certains attributs sont volontairement exclus de cette liste, car
-        ils requièrent un traitement spécifique.
-        
-        See Also
-        --------
-        WidgetKey.copy, GroupOfValuesKey.copy
-        
-        Notes
-        -----
-        Réécriture de la propriété :py:attr:`WidgetKey.attr_to_copy`.
-        
-        """
-        return { 'order_idx': True, 'parent': True, 'predicate': True,
-            'rdfclass': True, 'sources': True, 'datatype': True, 'transform': True,
-            'with_minus_buttons' : True, 'label': True, 'description': True,
-            'placeholder': True, 'input_mask': True, 'is_mandatory': True,
-            'is_read_only': True, 'regex_validator': True,
-            'regex_validator_flags': True, 'geo_tools': True, 'compute': True }
+    attr_to_copy = (('order_idx', True), ('parent', True), ('predicate', True),
+        ('rdfclass', True), ('sources', True), ('datatype', True),
+        ('transform', True), ('with_minus_buttons', True), ('label', True),
+        ('description', True), ('placeholder', True), ('input_mask', True),
+        ('is_mandatory', True), ('is_read_only', True),
+        ('regex_validator', True), ('regex_validator_flags', True),
+        ('geo_tools', True), ('compute', True))
+    """tuple(tuple(str, bool)): Attributs de la classe à prendre en compte pour la copie des clés.
+    
+    Cet attribut est un tuple de couples dont le premier élément
+    est le nom d'un attribut contenant des informations nécessaires
+    pour dupliquer la clé, et le second un booléen qui indique
+    si l'attribut est à prendre en compte lorsqu'il s'agit de
+    créer une copie vide de la clé.
+    
+    Certains attributs sont volontairement exclus de cette liste, car
+    ils requièrent un traitement spécifique.
+    
+    See Also
+    --------
+    WidgetKey.copy, GroupOfValuesKey.copy
+    
+    Notes
+    -----
+    Réécriture de l'attribut :py:attr:`WidgetKey.attr_to_copy`.
+    
+    """
 
     def copy(self, parent=None, empty=True):
         """Renvoie une copie de la clé.
@@ -3238,9 +3509,10 @@ class GroupOfValuesKey(GroupKey):
             des fantômes, ceux-ci ne seront simplement pas copiés.
         
         """
-        key = super().copy(parent=parent, empty=empty)
-        if self.button:
-            self.button.copy(parent=key, empty=empty)
+        with WidgetKey.bulk_update():
+            key = super().copy(parent=parent, empty=empty)
+            if self.button:
+                self.button.copy(parent=key, empty=empty)
         return key
 
     def compute_rows(self):
@@ -3439,6 +3711,8 @@ class TranslationGroupKey(GroupOfValuesKey):
     toujours ``None``.
     
     """
+    __slots__ = ('_available_languages',)
+
     def __new__(cls, **kwargs):
         # crée un groupe de valeurs au lieu d'un groupe de
         # traduction dans le cas d'un fantôme
@@ -3447,19 +3721,17 @@ class TranslationGroupKey(GroupOfValuesKey):
             or not WidgetKey.with_language_buttons:
             # si `parent` n'était pas spécifié, il y aura de toute
             # façon une erreur à l'initialisation
-            return GroupOfValuesKey.__call__(**kwargs)
+            return GroupOfValuesKey(**kwargs)
         return super().__new__(cls)
     
     def _base_attributes(self, **kwargs):
         super()._base_attributes(**kwargs)
         self._available_languages = WidgetKey.langlist.copy()
 
-    @property
-    def key_object(self):
-        """str: Transcription littérale du type de clé.
-        
-        """
-        return 'translation group'
+    key_object = 'translation group'
+    """str: Transcription littérale du type de clé.
+    
+    """
 
     @property
     def available_languages(self):
@@ -3472,29 +3744,22 @@ class TranslationGroupKey(GroupOfValuesKey):
         """
         return self._available_languages
 
-    @property
-    def rdfclass(self):
-        return None
-        
-    @rdfclass.setter
-    def rdfclass(self, value):
-        self._rdfclass = None
-        
-    @property
-    def sources(self):
-        return None
-        
-    @sources.setter
-    def sources(self, value):
-        self._sources = None
+    attr_to_update = GroupOfValuesKey.attr_to_update \
+        - {'rdfclass', 'sources', 'transform'}
+    """frozenset(str): Ensemble des attributs et propriétés pouvant être redéfinis post initialisation.
+    
+    Notes
+    -----
+    Réécriture de l'attribut :py:attr:`GroupOfValuesKey.attr_to_update`.
+    
+    """
 
-    @property
-    def transform(self):
-        return None
-        
-    @transform.setter
-    def transform(self, value):
-        self._transform = None
+    # propriétés qui valent toujours None pour un groupe de
+    # traduction. Elles ne sont pas initialisées par
+    # GroupOfValuesKey._computed_attributes, et toute tentative
+    # de modification est silencieusement ignorée.
+    rdfclass = sources = transform = property(lambda self: None,
+        lambda self, value: None)
 
     @property
     def datatype(self):
@@ -3513,6 +3778,19 @@ class TranslationGroupKey(GroupOfValuesKey):
     def datatype(self, value):
         self._datatype = RDF.langString
 
+    def _set_raw_datatype(self, value):
+        self._datatype = RDF.langString
+
+    def _child_added(self, child):
+        if type(child) is ValueKey:
+            # NB : à l'initialisation, `language_out` est
+            # exécuté par le setter de `value_language`.
+            self.language_out(child.value_language)
+
+    def _child_removed(self, child):
+        if type(child) is ValueKey:
+            self.language_in(child.value_language)
+
     def language_in(self, value_language):
         """Ajoute une langue à la liste des langues disponibles.
         
@@ -3691,6 +3969,14 @@ class ValueKey(ObjectKey):
         `'manual'` et `'auto'` sont reconnues à ce stade.
     
     """
+    __slots__ = ('_predicate', '_label', '_description', '_m_twin',
+        '_is_main_twin', '_twin_skip_hide', '_do_not_save',
+        '_independant_label', '_sources', '_sources_set', '_rdfclass',
+        '_datatype', '_is_long_text', '_rowspan',
+        '_transform', '_placeholder', '_input_mask', '_is_mandatory',
+        '_is_read_only', '_regex_validator', '_regex_validator_flags',
+        '_geo_tools', '_compute', '_value', '_value_language',
+        '_value_source', '_value_unit')
     
     def __new__(cls, **kwargs):
         # inhibe la création de clés-valeurs fantôme sans
@@ -3707,6 +3993,7 @@ class ValueKey(ObjectKey):
         self._do_not_save = None
         self._independant_label = None
         self._sources = None
+        self._sources_set = None
         self._rdfclass = None
         self._datatype = None
         self._is_long_text = None
@@ -3729,31 +4016,33 @@ class ValueKey(ObjectKey):
         super()._computed_attributes(**kwargs)
         self.do_not_save = kwargs.get('do_not_save')
         self.independant_label = kwargs.get('independant_label')
-        self.sources = kwargs.get('sources')
-        self.rdfclass = kwargs.get('rdfclass')
-        self.datatype = kwargs.get('datatype')
+        if not isinstance(self.parent, GroupOfValuesKey):
+            # dans un groupe de valeurs, ces propriétés sont celles
+            # du groupe parent et leurs setters sont sans effet, il
+            # est donc inutile de les appeler
+            self.sources = kwargs.get('sources')
+            self.rdfclass = kwargs.get('rdfclass')
+            self._set_raw_datatype(kwargs.get('datatype'))
+            self.transform = kwargs.get('transform')
+            self.placeholder = kwargs.get('placeholder')
+            self.input_mask = kwargs.get('input_mask')
+            self.is_mandatory = kwargs.get('is_mandatory')
+            self.is_read_only = kwargs.get('is_read_only')
+            self.regex_validator = kwargs.get('regex_validator')
+            self.regex_validator_flags = kwargs.get('regex_validator_flags')
+            self.geo_tools = kwargs.get('geo_tools')
+            self.compute = kwargs.get('compute')
         self.is_long_text = kwargs.get('is_long_text')
         self.rowspan = kwargs.get('rowspan')
-        self.transform = kwargs.get('transform')
-        self.placeholder = kwargs.get('placeholder')
-        self.input_mask = kwargs.get('input_mask')
-        self.is_mandatory = kwargs.get('is_mandatory')
-        self.is_read_only = kwargs.get('is_read_only')
-        self.regex_validator = kwargs.get('regex_validator')
-        self.regex_validator_flags = kwargs.get('regex_validator_flags')
-        self.geo_tools = kwargs.get('geo_tools')
-        self.compute = kwargs.get('compute')
         self.value = kwargs.get('value')
         self.value_language = kwargs.get('value_language')
         self.value_source = kwargs.get('value_source')
         self.value_unit = None
 
-    @property
-    def key_object(self):
-        """str: Transcription littérale du type de clé.
-        
-        """
-        return 'edit'
+    key_object = 'edit'
+    """str: Transcription littérale du type de clé.
+    
+    """
     
     @property
     def rowspan(self):
@@ -3781,7 +4070,7 @@ class ValueKey(ObjectKey):
     @rowspan.setter
     def rowspan(self, value):
         old_value = self.rowspan
-        if not self:
+        if self._is_ghost:
             value = 0
         else:
             if not self.is_long_text or self.m_twin:
@@ -3796,7 +4085,8 @@ class ValueKey(ObjectKey):
                 value = int(value)
             if not isinstance(value, int) or value <= 0:
                 value = 1
-        value = min((value, WidgetKey.max_rowspan))
+        if value > WidgetKey.max_rowspan:
+            value = WidgetKey.max_rowspan
         self._rowspan = value
         if not self._is_unborn and old_value != value:
             self.parent.compute_rows()
@@ -3830,9 +4120,11 @@ class ValueKey(ObjectKey):
     @independant_label.setter
     def independant_label(self, value):
         old_value = self.independant_label
-        if self.m_twin or not self.has_label:
+        if self._is_ghost or self.m_twin or not self.label:
+            # équivaut à tester has_label, sans passer par
+            # la valeur booléenne de la clé
             value = False
-        value = bool(value)
+        value = True if value else False
         self._independant_label = value
         if not self._is_unborn and old_value != value:
             self.parent.compute_rows()
@@ -3846,7 +4138,7 @@ class ValueKey(ObjectKey):
         Réécriture de la propriété :py:attr:`WidgetKey.has_language_button`.
         
         """
-        return self and WidgetKey.with_language_buttons \
+        return WidgetKey.with_language_buttons and self \
             and self.datatype == RDF.langString \
             and not self.is_read_only
     
@@ -3859,7 +4151,7 @@ class ValueKey(ObjectKey):
         Réécriture de la propriété :py:attr:`WidgetKey.has_source_button`.
         
         """
-        return self and WidgetKey.with_source_buttons \
+        return WidgetKey.with_source_buttons and self \
             and ((self.sources and len(self.sources) > 1) or bool(self.m_twin)) \
             and not self.is_read_only
     
@@ -3875,7 +4167,7 @@ class ValueKey(ObjectKey):
         de type ``xsd:duration``.
         
         """
-        return self and WidgetKey.with_unit_buttons \
+        return WidgetKey.with_unit_buttons and self \
             and self.datatype == XSD.duration \
             and not self.is_read_only
     
@@ -3898,7 +4190,7 @@ class ValueKey(ObjectKey):
         les fonctionnalités d'édition.        
         
         """
-        return self and WidgetKey.with_geo_buttons \
+        return WidgetKey.with_geo_buttons and self \
             and bool(self.geo_tools)
     
     @property
@@ -3914,7 +4206,7 @@ class ValueKey(ObjectKey):
         deux seraient redondants.
         
         """
-        return self and WidgetKey.with_compute_buttons \
+        return WidgetKey.with_compute_buttons and self \
             and bool(self.compute) and 'manual' in self.compute \
             and not self.has_geo_button \
             and not self.is_read_only
@@ -4031,23 +4323,39 @@ class ValueKey(ObjectKey):
     @datatype.setter
     def datatype(self, value):
         if not isinstance(self.parent, GroupOfValuesKey):
-            tlist = [XSD.string, XSD.integer, XSD.decimal,
-                XSD.boolean, XSD.date, XSD.time, XSD.dateTime,
-                XSD.duration, GSP.wktLiteral, RDF.langString]
-            if self.rdfclass:
-                value = None
-            elif not value in tlist:
-                value = XSD.string
-            self._datatype = value
-            if not self._is_unborn:
-                self.geo_tools = self._geo_tools
-                # on réinitialise bien avec _geo_tools
-                # et pas geo_tools, car le second tronque
-                # la liste si la clé est en lecture seule
-                self.value_language = self.value_language
-                self.is_long_text = self.is_long_text
-                self.value_unit = self.value_unit
-    
+            self._set_raw_datatype(value)
+            self.geo_tools = self._geo_tools
+            # on réinitialise bien avec _geo_tools
+            # et pas geo_tools, car le second tronque
+            # la liste si la clé est en lecture seule
+            self.value_language = self.value_language
+            self.is_long_text = self.is_long_text
+            self.value_unit = self.value_unit
+
+    def _set_raw_datatype(self, value):
+        """Définit le type de valeur de la clé sans mise en cohérence des propriétés dépendantes.
+
+        Utilisée à l'initialisation de la clé, lorsque les
+        propriétés dépendantes n'ont pas encore été définies.
+        Sans effet si la clé appartient à un groupe de valeurs.
+
+        Parameters
+        ----------
+        value : rdflib.term.URIRef
+            Le type de valeur.
+
+        """
+        if isinstance(self.parent, GroupOfValuesKey):
+            return
+        tlist = [XSD.string, XSD.integer, XSD.decimal,
+            XSD.boolean, XSD.date, XSD.time, XSD.dateTime,
+            XSD.duration, GSP.wktLiteral, RDF.langString]
+        if self.rdfclass:
+            value = None
+        elif not value in tlist:
+            value = XSD.string
+        self._datatype = value
+
     @property
     def placeholder(self):
         """str: Texte de substitution à utiliser pour la clé.
@@ -4064,12 +4372,12 @@ class ValueKey(ObjectKey):
         """
         if isinstance(self.parent, GroupOfValuesKey):
             return self.parent.placeholder
-        return self._placeholder
+        return _lazy_str(self, '_placeholder')
 
     @placeholder.setter
     def placeholder(self, value):
         if not isinstance(self.parent, GroupOfValuesKey):
-            self._placeholder = str(value) if value else None
+            self._placeholder = value or None
     
     @property
     def input_mask(self):
@@ -4087,12 +4395,12 @@ class ValueKey(ObjectKey):
         """
         if isinstance(self.parent, GroupOfValuesKey):
             return self.parent.input_mask
-        return self._input_mask
+        return _lazy_str(self, '_input_mask')
 
     @input_mask.setter
     def input_mask(self, value):
         if not isinstance(self.parent, GroupOfValuesKey):
-            self._input_mask = str(value) if value else None
+            self._input_mask = value or None
     
     @property
     def is_mandatory(self):
@@ -4115,7 +4423,7 @@ class ValueKey(ObjectKey):
     @is_mandatory.setter
     def is_mandatory(self, value):
         if not isinstance(self.parent, GroupOfValuesKey):
-            self._is_mandatory = bool(value)
+            self._is_mandatory = True if value else False
     
     @property
     def is_read_only(self):
@@ -4138,7 +4446,7 @@ class ValueKey(ObjectKey):
     @is_read_only.setter
     def is_read_only(self, value):
         if not isinstance(self.parent, GroupOfValuesKey):
-            self._is_read_only = bool(value)
+            self._is_read_only = True if value else False
     
     @property
     def regex_validator(self):
@@ -4162,9 +4470,10 @@ class ValueKey(ObjectKey):
         :py:attr:`ValueKey.regex_validator_flags`.
         
         """
-        rv = self.parent.regex_validator \
-            if isinstance(self.parent, GroupOfValuesKey) \
-            else self._regex_validator
+        if isinstance(self.parent, GroupOfValuesKey):
+            rv = self.parent.regex_validator
+        else:
+            rv = _lazy_str(self, '_regex_validator')
         if not rv and self.rdfclass and not self.sources:
             return r'^[^<>"\s{}|\\^`]*$'
         else:
@@ -4173,7 +4482,7 @@ class ValueKey(ObjectKey):
     @regex_validator.setter
     def regex_validator(self, value):
         if not isinstance(self.parent, GroupOfValuesKey):
-            self._regex_validator = str(value) if value else None
+            self._regex_validator = value or None
             if not self._is_unborn:
                 self.regex_validator_flags = self.regex_validator_flags
     
@@ -4197,14 +4506,14 @@ class ValueKey(ObjectKey):
         """
         if isinstance(self.parent, GroupOfValuesKey):
             return self.parent.regex_validator_flags
-        return self._regex_validator_flags
+        return _lazy_str(self, '_regex_validator_flags')
 
     @regex_validator_flags.setter
     def regex_validator_flags(self, value):
         if not isinstance(self.parent, GroupOfValuesKey):
             if not self.regex_validator:
                 value = None
-            self._regex_validator_flags = str(value) if value else None
+            self._regex_validator_flags = value or None
     
     @property
     def geo_tools(self):
@@ -4314,7 +4623,7 @@ class ValueKey(ObjectKey):
             value = None
         elif not value and isinstance(self.value, Literal):
             value = self.value.language
-        if isinstance(self.parent, TranslationGroupKey):
+        if type(self.parent) is TranslationGroupKey:
             if not value:
                 if self.available_languages:
                     value = self.available_languages[0]
@@ -4358,7 +4667,13 @@ class ValueKey(ObjectKey):
         else:
             if not value and not self.value:
                 value = self.sources[0]
-            if value in self.sources:
+            # test d'appartenance sur l'ensemble plutôt que
+            # sur la liste ordonnée des sources
+            if isinstance(self.parent, GroupOfValuesKey):
+                sources_set = self.parent._sources_set
+            else:
+                sources_set = self._sources_set
+            if value in sources_set:
                 self._value_source = value
             else:
                 self._value_source = None
@@ -4424,7 +4739,7 @@ class ValueKey(ObjectKey):
         
     @do_not_save.setter
     def do_not_save(self, value):
-        self._do_not_save = bool(value)
+        self._do_not_save = True if value else False
     
     @property
     def is_long_text(self):
@@ -4507,6 +4822,7 @@ class ValueKey(ObjectKey):
         if not isinstance(self.parent, GroupOfValuesKey) \
             and self.sources != value:
             self._sources = value
+            self._sources_set = frozenset(value) if value else None
             WidgetKey.actionsbook.sources.append(self)
             if not self._is_unborn and self.value_source:
                 # pour le cas où value_source ne serait plus
@@ -4525,8 +4841,9 @@ class ValueKey(ObjectKey):
         si le type de valeur ne suppose pas de langue.
         
         """
-        if isinstance(self.parent, TranslationGroupKey):
-            return self.parent.available_languages
+        parent = self.parent
+        if type(parent) is TranslationGroupKey:
+            return parent._available_languages
         elif self.datatype == RDF.langString:
             return WidgetKey.langlist
 
@@ -4546,57 +4863,55 @@ class ValueKey(ObjectKey):
             return ['ans', 'mois', 'jours', 'heures', 'min.', 'sec.']
 
     def _hide_m(self, value, rec=False):
-        if rec and value and self.m_twin and not self.is_main_twin:
+        if rec and value and self._twin_skip_hide:
             return
         super()._hide_m(value, rec=rec)
 
-    @property
-    def attr_to_update(self):
-        """list(str): Liste des attributs et propriétés pouvant être redéfinis post initialisation.
-        
-        Notes
-        -----
-        Réécriture de la propriété :py:attr:`WidgetKey.attr_to_update`.
-        
-        """
-        return ['order_idx', 'predicate', 'label', 'description', 'is_hidden_m',
-            'rowspan', 'value', 'rdfclass', 'datatype', 'placeholder',
-            'input_mask', 'is_mandatory', 'is_read_only', 'regex_validator', 
-            'regex_validator_flags', 'value_language', 'value_source',
-            'do_not_save', 'is_long_text', 'transform', 'sources', 'independant_label',
-            'value_unit', 'geo_tools', 'compute']
+    attr_to_update = frozenset(('order_idx', 'predicate', 'label',
+        'description', 'is_hidden_m', 'rowspan', 'value', 'rdfclass',
+        'datatype', 'placeholder', 'input_mask', 'is_mandatory',
+        'is_read_only', 'regex_validator', 'regex_validator_flags',
+        'value_language', 'value_source', 'do_not_save', 'is_long_text',
+        'transform', 'sources', 'independant_label', 'value_unit', 'geo_tools',
+        'compute'))
+    """frozenset(str): Ensemble des attributs et propriétés pouvant être redéfinis post initialisation.
+    
+    Notes
+    -----
+    Réécriture de l'attribut :py:attr:`WidgetKey.attr_to_update`.
+    
+    """
 
-    @property
-    def attr_to_copy(self):
-        """dict: Attributs de la classe à prendre en compte pour la copie des clés.
-        
-        Cette propriété est un dictionnaire dont les clés sont les
-        noms des attributs contenant les informations nécessaires pour
-        dupliquer la clé, et les valeurs sont des booléens qui indiquent
-        si l'attribut est à prendre en compte lorsqu'il s'agit de
-        créer une copie vide de la clé.
-        
-        Certains attributs sont volontairement exclus de cette liste, car
-        ils requièrent un traitement spécifique.
-        
-        See Also
-        --------
-        WidgetKey.copy
-        
-        Notes
-        -----
-        Réécriture de la propriété :py:attr:`WidgetKey.attr_to_copy`.
-        
-        """
-        return { 'order_idx': True, 'parent': True, 'predicate': True,
-            'label': True, 'description': True, 'do_not_save': True,
-            'sources': True, 'rdfclass': True, 'datatype': True, 'transform': True,
-            'rowspan': True, 'value': False, 'value_language': False,
-            'value_source': False, 'placeholder': True, 'input_mask': True,
-            'is_mandatory': True, 'is_read_only': True, 'regex_validator': True,
-            'regex_validator_flags': True, 'is_long_text': True,
-            'independant_label': True, 'value_unit': False, 'geo_tools': True,
-            'compute': True }
+    attr_to_copy = (('order_idx', True), ('parent', True), ('predicate', True),
+        ('label', True), ('description', True), ('do_not_save', True),
+        ('sources', True), ('rdfclass', True), ('datatype', True),
+        ('transform', True), ('rowspan', True), ('value', False),
+        ('value_language', False), ('value_source', False),
+        ('placeholder', True), ('input_mask', True), ('is_mandatory', True),
+        ('is_read_only', True), ('regex_validator', True),
+        ('regex_validator_flags', True), ('is_long_text', True),
+        ('independant_label', True), ('value_unit', False),
+        ('geo_tools', True), ('compute', True))
+    """tuple(tuple(str, bool)): Attributs de la classe à prendre en compte pour la copie des clés.
+    
+    Cet attribut est un tuple de couples dont le premier élément
+    est le nom d'un attribut contenant des informations nécessaires
+    pour dupliquer la clé, et le second un booléen qui indique
+    si l'attribut est à prendre en compte lorsqu'il s'agit de
+    créer une copie vide de la clé.
+    
+    Certains attributs sont volontairement exclus de cette liste, car
+    ils requièrent un traitement spécifique.
+    
+    See Also
+    --------
+    WidgetKey.copy
+    
+    Notes
+    -----
+    Réécriture de l'attribut :py:attr:`WidgetKey.attr_to_copy`.
+    
+    """
 
     def copy(self, parent=None, empty=True):
         """Renvoie une copie de la clé.
@@ -4662,11 +4977,10 @@ class ValueKey(ObjectKey):
         
         """
         if self.is_hidden:
-            return ActionsBook()
-        if not append_book:
-            WidgetKey.clear_actionsbook()
-        self.value_language = value_language
-        return WidgetKey.unload_actionsbook(preserve_book=append_book)
+            return WidgetKey.EMPTY_ACTIONSBOOK
+        with WidgetKey.actions_scope(append_book) as book:
+            self.value_language = value_language
+        return book
     
     def change_source(self, value_source, append_book=False):
         """Change la source d'une clé-valeur.
@@ -4691,11 +5005,10 @@ class ValueKey(ObjectKey):
         
         """
         if self.is_hidden:
-            return ActionsBook()
-        if not append_book:
-            WidgetKey.clear_actionsbook()
-        self.value_source = value_source
-        return WidgetKey.unload_actionsbook(preserve_book=append_book)
+            return WidgetKey.EMPTY_ACTIONSBOOK
+        with WidgetKey.actions_scope(append_book) as book:
+            self.value_source = value_source
+        return book
 
     def change_unit(self, value_unit, append_book=False):
         """Change l'unité d'une clé-valeur.
@@ -4720,11 +5033,10 @@ class ValueKey(ObjectKey):
         
         """
         if self.is_hidden:
-            return ActionsBook()
-        if not append_book:
-            WidgetKey.clear_actionsbook()
-        self.value_unit = value_unit
-        return WidgetKey.unload_actionsbook(preserve_book=append_book)
+            return WidgetKey.EMPTY_ACTIONSBOOK
+        with WidgetKey.actions_scope(append_book) as book:
+            self.value_unit = value_unit
+        return book
 
     def _build_metagraph(self, metagraph):
         if self.do_not_save or self.is_hidden_m or self.value is None:
@@ -4734,6 +5046,54 @@ class ValueKey(ObjectKey):
         metagraph.add((self.parent.node, self.predicate, self.value))
         return True
 
+# types de clés admis comme parents d'un bouton plus
+_PARENT_OK = (GroupOfValuesKey, TranslationGroupKey)
+
+def _paste_replace(widgetkey, refkey):
+    """Colle une branche à la place de la branche de même nature.
+    
+    Parameters
+    ----------
+    widgetkey : GroupOfPropertiesKey or GroupOfValuesKey
+        La clé correspondant à la base de la branche à copier.
+    refkey : GroupOfPropertiesKey or GroupOfValuesKey
+        La clé de l'arbre cible à remplacer.
+    
+    """
+    refkey.kill()
+    widgetkey.copy(parent=refkey.parent, empty=False)
+
+def _paste_add(widgetkey, refkey):
+    """Colle un groupe de propriétés dans un groupe de valeurs.
+    
+    La copie n'est réalisée que si le groupe de valeurs a
+    un bouton plus visible.
+    
+    Parameters
+    ----------
+    widgetkey : GroupOfPropertiesKey
+        La clé correspondant à la base de la branche à copier.
+    refkey : GroupOfValuesKey
+        Le groupe de valeurs de l'arbre cible.
+    
+    """
+    if refkey.button and not refkey.button.is_hidden:
+        widgetkey.copy(parent=refkey, empty=False)
+
+# opérations réalisées par RootKey.paste_from_path, selon
+# le type de la clé à coller et celui de la clé cible
+_PASTE_DISPATCH = {
+    (GroupOfPropertiesKey, GroupOfPropertiesKey): _paste_replace,
+    (GroupOfValuesKey, GroupOfValuesKey): _paste_replace,
+    (TranslationGroupKey, TranslationGroupKey): _paste_replace,
+    (GroupOfPropertiesKey, GroupOfValuesKey): _paste_add,
+    (GroupOfPropertiesKey, TranslationGroupKey): _paste_add
+    }
+
+# types de clés pouvant être copiées/collées par
+# RootKey.paste_from_path, déduits de la table précédente
+_PASTABLE = frozenset(source for source, target in _PASTE_DISPATCH)
+
 class PlusButtonKey(WidgetKey):
     """Bouton plus.
     
@@ -4761,20 +5121,19 @@ class PlusButtonKey(WidgetKey):
         fantôme ne produira rien.
     
     """
+    __slots__ = ()
     
     def __new__(cls, **kwargs):
         parent = kwargs.get('parent')
         if kwargs.get('is_ghost', False) or not parent \
-            or not isinstance(parent, GroupOfValuesKey):
+            or not type(parent) in _PARENT_OK:
             return
         return super().__new__(cls)
 
-    @property
-    def key_object(self):
-        """str: Transcription littérale du type de clé.
-        
-        """
-        return 'plus button'
+    key_object = 'plus button'
+    """str: Transcription littérale du type de clé.
+    
+    """
         
     def _validate_parent(self, parent):
         return type(parent) == GroupOfValuesKey
@@ -4870,13 +5229,12 @@ class PlusButtonKey(WidgetKey):
         
         """
         if self.is_hidden:
-            return ActionsBook()
-        if not append_book:
-            WidgetKey.clear_actionsbook()
-        for child in self.parent.real_children():
-            child.copy(parent=self.parent, empty=True)
-            break
-        return WidgetKey.unload_actionsbook(preserve_book=append_book)
+            return WidgetKey.EMPTY_ACTIONSBOOK
+        with WidgetKey.actions_scope(append_book) as book:
+            child = self.parent.first_real_child()
+            if child:
+                child.copy(parent=self.parent, empty=True)
+        return book
     
 
 class TranslationButtonKey(PlusButtonKey):
@@ -4903,6 +5261,7 @@ class TranslationButtonKey(PlusButtonKey):
         tenter de créer un bouton de traduction fantôme ne produira rien.
     
     """
+    __slots__ = ()
     
     def __new__(cls, **kwargs):
         parent = kwargs.get('parent')
@@ -4910,16 +5269,14 @@ class TranslationButtonKey(PlusButtonKey):
             # inhibe la création de boutons fantômes ou sans
             # parent
             return
-        if not isinstance(parent, TranslationGroupKey):
-            return PlusButtonKey.__call__(**kwargs)
+        if not type(parent) is TranslationGroupKey:
+            return PlusButtonKey(**kwargs)
         return super().__new__(cls, **kwargs)
    
-    @property
-    def key_object(self):
-        """str: Transcription littérale du type de clé.
-        
-        """
-        return 'translation button'
+    key_object = 'translation button'
+    """str: Transcription littérale du type de clé.
+    
+    """
     
     @property
     def description(self):
@@ -4945,7 +5302,7 @@ class TranslationButtonKey(PlusButtonKey):
         return not self.parent.available_languages
 
     def _validate_parent(self, parent):
-        return isinstance(parent, TranslationGroupKey)
+        return type(parent) is TranslationGroupKey
 
 
 class RootKey(GroupKey):
@@ -4971,11 +5328,14 @@ class RootKey(GroupKey):
     dans ce sens serait ignorée.
     
     """
+    __slots__ = ('_node', '_is_hidden_b', '_rowspan')
+
     def _heritage(self, **kwargs):
         return
     
     def _base_attributes(self, **kwargs):
         self._node = None
+        self._is_ghost = False
         self._is_hidden_m = False
         self._is_hidden_b = False
         self._rowspan = 0
@@ -5018,12 +5378,10 @@ class RootKey(GroupKey):
             value = DatasetId()
         self._node = value
  
-    @property
-    def key_object(self):
-        """str: Transcription littérale du type de clé.
-        
-        """
-        return 'root'
+    key_object = 'root'
+    """str: Transcription littérale du type de clé.
+    
+    """
     
     @property
     def parent(self):
@@ -5041,16 +5399,14 @@ class RootKey(GroupKey):
     def placement(self):
         return
  
-    @property
-    def rdfclass(self):
-        """rdflib.term.URIRef: Classe RDF.
-        
-        Notes
-        -----
-        Vaut toujours ``dcat:Dataset``.
-        
-        """
-        return DCAT.Dataset
+    rdfclass = DCAT.Dataset
+    """rdflib.term.URIRef: Classe RDF.
+    
+    Notes
+    -----
+    Vaut toujours ``dcat:Dataset``.
+    
+    """
 
     @property
     def tree_idx(self):
@@ -5059,13 +5415,9 @@ class RootKey(GroupKey):
         """
         return (0,)
 
-    @property
-    def attr_to_copy(self):
-        return {}
+    attr_to_copy = ()
 
-    @property
-    def attr_to_update(self):
-        return []
+    attr_to_update = frozenset()
 
     def kill(self):
         return
@@ -5117,6 +5469,7 @@ class RootKey(GroupKey):
         """
         matchlist = []
         self._search_from_rdfclass(rdfclass, matchlist)
+        return matchlist
 
     def search_from_uuid(self, uuid):
         """Renvoie la clé de l'arbre dont l'identifiant est l'UUID recherché.
@@ -5166,22 +5519,19 @@ class RootKey(GroupKey):
         if widgetkey.is_hidden:
             raise ForbiddenOperation("Il n'est pas permis de " \
                 'copier/coller une branche fantôme ou masquée.', self)
-        if not isinstance(widgetkey, (GroupOfPropertiesKey, GroupOfValuesKey)):
+        if not type(widgetkey) in _PASTABLE:
             raise ForbiddenOperation('Seuls les groupes de valeurs, de ' \
                 'traduction ou de propriétés peuvent être copiés/collés.',
                 self)
-        WidgetKey.clear_actionsbook()
         refkey = self.search_from_path(widgetkey.path)
         if not refkey or refkey.is_hidden:
-            return ActionsBook()
-        if type(refkey) == type(widgetkey):
-            refkey.kill()
-            widgetkey.copy(parent=refkey.parent, empty=False)  
-        elif isinstance(widgetkey, GroupOfPropertiesKey) and \
-            isinstance(refkey, GroupOfValuesKey) and refkey.button \
-            and not refkey.button.is_hidden:
-            widgetkey.copy(parent=refkey, empty=False)
-        return WidgetKey.unload_actionsbook()
+            return WidgetKey.EMPTY_ACTIONSBOOK
+        handler = _PASTE_DISPATCH.get((type(widgetkey), type(refkey)))
+        with WidgetKey.actions_scope() as book:
+            if handler is not None:
+                with WidgetKey.bulk_update():
+                    handler(widgetkey, refkey)
+        return book
 
     def clean(self):
         """Balaie l'arbre de clés et supprime tous les groupes sans fille.
@@ -5213,9 +5563,10 @@ class RootKey(GroupKey):
         du carnet d'actions.
         
         """
-        WidgetKey.clear_actionsbook(allow_ghosts=True)
-        self._clean()
-        return WidgetKey.unload_actionsbook()
+        with WidgetKey.actions_scope(allow_ghosts=True) as book, \
+            WidgetKey.bulk_update():
+            self._clean()
+        return book
 
     def build_metagraph(self):
         """Traduit l'arbre de clés en graphe de métadonnées.
@@ -5253,25 +5604,21 @@ class ChildrenList(list):
     autorisées.
     
     """
+    __slots__ = ()
+
     def append(self, value):
         super().append(value)
         if value and not value._is_unborn:
-            value.parent.compute_rows()
-            value.parent.compute_single_children()
-            if isinstance(value.parent, TranslationGroupKey) \
-                and isinstance(value, ValueKey):
-                # NB : à l'initialisation, `language_out` est
-                # exécuté par le setter de `value_language`.
-                value.parent.language_out(value.value_language)
-        
+            parent = value.parent
+            parent._compute_or_defer()
+            parent._child_added(value)
+    
     def remove(self, value):
         super().remove(value)
+        parent = value.parent
         if value:
-            value.parent.compute_rows()
-            value.parent.compute_single_children()
-        if isinstance(value.parent, TranslationGroupKey) \
-            and isinstance(value, ValueKey):
-            value.parent.language_in(value.value_language)
+            parent._compute_or_defer()
+        parent._child_removed(value)
 
 
 
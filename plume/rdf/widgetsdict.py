@@ -24,12 +24,11 @@ from plume.rdf.utils import sort_by_language, DatasetId, forbidden_char, \
     tel_from_owlthing, duration_from_int, int_from_duration, str_from_duration, \
     str_from_datetime, str_from_date, str_from_time, datetime_from_str, \
     date_from_str, time_from_str, decimal_from_str, str_from_decimal, \
-    main_datatype
+    langstring_from_str, uriref_from_str, main_datatype
 from plume.rdf.widgetkey import WidgetKey, ValueKey, GroupOfPropertiesKey, \
     GroupOfValuesKey, TranslationGroupKey, TranslationButtonKey, \
-    PlusButtonKey, ObjectKey, RootKey, TabKey, GroupKey
+    PlusButtonKey, RootKey, TabKey, GroupKey
 from plume.rdf.internaldict import InternalDict
-from plume.rdf.actionsbook import ActionsBook
 from plume.rdf.exceptions import IntegrityBreach, MissingParameter, \
     UnknownParameterValue, ForbiddenOperation
 from plume.rdf.thesaurus import Thesaurus
@@ -37,6 +36,74 @@ from plume.rdf.namespaces import PlumeNamespaceManager, SH, RDF, XSD, PLUME, GSP
 from plume.rdf.properties import PlumeProperty, class_properties
 from plume.pg.computer import computation_method
 
+# type de widget selon la classe de la clé, pour toutes
+# les clés autres que les clés-valeurs
+_KEY_CLASS_TO_WIDGET = {
+    RootKey: None,
+    TabKey: 'QGroupBox',
+    GroupOfPropertiesKey: 'QGroupBox',
+    GroupOfValuesKey: 'QGroupBox',
+    TranslationGroupKey: 'QGroupBox',
+    PlusButtonKey: 'QToolButton',
+    TranslationButtonKey: 'QToolButton'
+    }
+
+# type de widget de saisie selon le type de la valeur, pour
+# les types qui ne se contentent pas d'un QLineEdit
+_DATATYPE_TO_WIDGET = {
+    XSD.date: 'QDateEdit',
+    XSD.dateTime: 'QDateTimeEdit',
+    XSD.time: 'QTimeEdit'
+    }
+
+# validateur selon le type de la valeur
+_DATATYPE_TO_VALIDATOR = {
+    XSD.integer: 'QIntValidator',
+    XSD.decimal: 'QDoubleValidator',
+    XSD.float: 'QDoubleValidator',
+    XSD.double: 'QDoubleValidator',
+    XSD.duration: 'QIntValidator'
+    }
+
+# fonctions de conversion en IRI selon la transformation
+# appliquée à la valeur (cf. ValueKey.transform)
+_TRANSFORM_TO_IRI = {
+    'email': owlthing_from_email,
+    'phone': owlthing_from_tel
+    }
+
+# fonctions de conversion inverses, de l'IRI vers la chaîne
+# de caractères affichée
+_TRANSFORM_FROM_IRI = {
+    'email': email_from_owlthing,
+    'phone': tel_from_owlthing
+    }
+
+# fonctions de désérialisation des valeurs saisies, pour les
+# types dont la valeur n'est pas simplement la chaîne de caractères
+_DATATYPE_FROM_STR = {
+    XSD.date: date_from_str,
+    XSD.dateTime: datetime_from_str,
+    XSD.time: time_from_str,
+    XSD.decimal: decimal_from_str
+    }
+
+# fonctions de sérialisation des valeurs pour l'affichage,
+# pour les mêmes types
+_DATATYPE_TO_STR = {
+    XSD.date: str_from_date,
+    XSD.dateTime: str_from_datetime,
+    XSD.time: str_from_time,
+    XSD.decimal: str_from_decimal
+    }
+
+# types Python attendus pour les valeurs littérales dont
+# la validité est contrôlée avant affichage
+_DATATYPE_TO_PYTHON = {XSD.integer: int, XSD.boolean: bool}
+
+# types des valeurs littérales restituées telles quelles
+_TEXT_DATATYPES = (RDF.langString, XSD.string)
+
 class WidgetsDict(dict):
     """Classe pour les dictionnaires de widgets.
     
@@ -182,6 +249,8 @@ class WidgetsDict(dict):
         
         # ------ Paramètres utilisateur ------
         self.mode = mode if mode in ('edit', 'read') else 'edit'
+        edit = self.mode == 'edit'
+        # NB: équivalent local de la propriété `edit`
         self.langlist = tuple(langList) if langList \
             and isinstance(langList, (list, tuple)) else ('fr', 'en')
         if not language in self.langlist:
@@ -192,12 +261,12 @@ class WidgetsDict(dict):
             and isinstance(valueLengthLimit, int) else 65
         self.textEditRowSpan = textEditRowSpan if textEditRowSpan \
             and isinstance(textEditRowSpan, int) else 6
-        self.translation = bool(translation) and self.edit
-        self.hideBlank = bool(readHideBlank) and not self.edit
-        self.hideUnlisted = (bool(readHideUnlisted) and not self.edit) \
-            or (bool(editHideUnlisted) and self.edit)
-        self.onlyCurrentLanguage = (bool(readOnlyCurrentLanguage) and not self.edit) \
-            or (bool(editOnlyCurrentLanguage) and self.edit and not self.translation)
+        self.translation = bool(translation) and edit
+        self.hideBlank = bool(readHideBlank) and not edit
+        self.hideUnlisted = (bool(readHideUnlisted) and not edit) \
+            or (bool(editHideUnlisted) and edit)
+        self.onlyCurrentLanguage = (bool(readOnlyCurrentLanguage) and not edit) \
+            or (bool(editOnlyCurrentLanguage) and edit and not self.translation)
         
         # ------ Racine ------
         # + gestion de l'identifiant
@@ -210,7 +279,7 @@ class WidgetsDict(dict):
         old_datasetid = metagraph.datasetid if metagraph else None
         self.root = RootKey(datasetid=old_datasetid)
         self.datasetid = DatasetId(old_uuid, old_datasetid)
-        if self.edit:
+        if edit:
             data['dct:identifier'] = [str(self.datasetid.uuid)]
         # à ce stade, on a nécessairement un UUID valide dans
         # l'attribut datasetid. Par contre, l'identifiant de la
@@ -221,39 +290,43 @@ class WidgetsDict(dict):
         # contenu du graphe.
         
         # paramètres de configuration des clés
-        WidgetKey.with_source_buttons = self.edit
-        WidgetKey.with_unit_buttons = self.edit
+        WidgetKey.with_source_buttons = edit
+        WidgetKey.with_unit_buttons = edit
         WidgetKey.with_language_buttons = self.translation
         WidgetKey.with_geo_buttons = True
         # NB: les boutons d'aide à la saisie des géométries
         # sont autorisés en mode lecture. Le fait que la clé
         # soit en lecture seule limitera les fonctionnalités
         # disponibles à celles qui ont trait à la visualisation.
-        WidgetKey.with_compute_buttons = self.edit
+        WidgetKey.with_compute_buttons = edit
         WidgetKey.langlist = list(self.langlist)
         self.root.main_language = language
         self.langlist = tuple(WidgetKey.langlist)
         # NB: pour avoir la liste triée dans le bon ordre
-        WidgetKey.max_rowspan = 30 if self.edit else 1
+        
+        # libellés et termes des thésaurus, mémorisés par
+        # source pour ce tuple de langues
+        self._thesaurus_labels = {}
+        self._thesaurus_values = {}
+        WidgetKey.max_rowspan = 30 if edit else 1
         
         # ------ Onglets ------
+        # libellés et indices des onglets, dans l'ordre de création
         if template and template.tabs:
-            i = 1
-            for label in template.tabs:
-                tabkey = TabKey(parent=self.root, label=label,
-                    order_idx=(i,))
-                i += 1
+            tabs = [(label, (i,)) for i, label
+                in enumerate(template.tabs, start=1)]
             # s'il n'existe pas déjà, on ajoute un
             # onglet "Autres" pour les catégories hors
             # modèle
             if not 'Autres' in template.tabs:
-                tabkey = TabKey(parent=self.root, label='Autres',
-                    order_idx=(9999,))
+                tabs.append(('Autres', (9999,)))
         else:
-            tabkey = TabKey(parent=self.root, label='Général', order_idx=(0,))
-            # et on ajoute un onglet "Autres"
+            # onglet "Général", et onglet "Autres"
             # pour les catégories hors modèle
-            tabkey = TabKey(parent=self.root, label='Autres', order_idx=(9999,))
+            tabs = [('Général', (0,)), ('Autres', (9999,))]
+        for label, order_idx in tabs:
+            tabkey = TabKey(parent=self.root, label=label,
+                order_idx=order_idx)
         
         # ------ Colonnes de la table ------
         if columns:
@@ -264,7 +337,7 @@ class WidgetsDict(dict):
                     is_long_text=True, description='Description du champ',
                     rowspan=self.textEditRowSpan, predicate=PLUME.column,
                     do_not_save=True, independant_label=True,
-                    is_read_only=not self.edit)
+                    is_read_only=not edit)
         
         # ------ Construction récursive ------
         self._build_tree(parent=self.root, metagraph=metagraph, \
@@ -280,198 +353,300 @@ class WidgetsDict(dict):
         
         # ------ Calcul des dictionnaires internes ------
         # et référencement dans le dictionnaire
+        # NB: le dictionnaire est encore vide et les fantômes
+        # sont exclus de l'arbre parcouru, les contrôles de
+        # :py:meth:`WidgetsDict.internalize` sont donc superflus
+        internalizers = self._internalizers
+        widget_type = self.widget_type
         for widgetkey in self.root.tree_keys():
-            self.internalize(widgetkey)
+            internaldict = InternalDict()
+            self[widgetkey] = internaldict
+            internaldict['object'] = widgetkey.key_object
+            internaldict['main widget type'] = widget_type(widgetkey)
+            internalizers[type(widgetkey)](self, widgetkey, internaldict)
 
     def _build_tree(self, parent, metagraph=None, template=None, data=None):
-        # ------ Constitution de la liste des catégories ------
-        # catégories communes de la classe :
-        properties, predicates = class_properties(rdfclass=parent.rdfclass,
-            nsm=self.nsm, base_path=parent.path, template=template)
+        # L'arbre est construit par un parcours en profondeur reposant
+        # sur une pile explicite plutôt que sur des appels récursifs :
+        # les groupes de propriétés créés pour les noeuds anonymes sont
+        # empilés, et leurs catégories sont traitées par les itérations
+        # suivantes de la boucle.
+        
+        # paramètres et constantes utilisés pour chaque catégorie
+        edit = self.edit
+        translation = self.translation
+        hideBlank = self.hideBlank
+        hideUnlisted = self.hideUnlisted
+        onlyCurrentLanguage = self.onlyCurrentLanguage
+        main_language = self.main_language
+        valueLengthLimit = self.valueLengthLimit
+        labelLengthLimit = self.labelLengthLimit
+        textEditRowSpan = self.textEditRowSpan
+        langstring = RDF.langString
+        rdf_type = RDF.type
+        sh_literal = SH.Literal
+        sh_iri = SH.IRI
+        sh_bnode = SH.BlankNode
+        sh_bnode_or_iri = SH.BlankNodeOrIRI
+        uriref_or_literal = (URIRef, Literal)
+        
+        # catégories communes déjà calculées, par classe et
+        # chemin du groupe parent (le modèle est le même pour
+        # toute la construction)
+        shared_properties = {}
+        
+        # onglets de la racine, par libellé, pour le choix de
+        # l'onglet des catégories de premier niveau. Comme avec
+        # `search_tab`, le premier est retenu en cas de doublon.
+        tabs = {}
         if isinstance(parent, RootKey):
-            # catégories locales:
-            if template:
-                for n3_path in template.local.keys():
-                    p = PlumeProperty(origin='local', nsm=self.nsm,
-                        n3_path=n3_path, template=template)
-                    properties.append(p)
-                    predicates.append(p.predicate)
-            # catégories non référencées
-            # en principe il s'agit simplement de catégories locales
-            # qui ne sont pas référencées par le modèle considéré
+            for child in parent.real_children():
+                if isinstance(child, TabKey):
+                    tabs.setdefault(child.label, child)
+        first_tab = next(iter(tabs.values()), None)
+        
+        stack = [parent]
+        while stack:
+            parent = stack.pop()
+            nodekeys = []
+            
+            # ------ Valeurs du graphe pour le sujet considéré ------
+            # rassemblées par prédicat en un seul parcours du graphe
+            po_map = {}
             if metagraph:
                 for predicate, o in metagraph.predicate_objects(parent.node):
-                    if not predicate in predicates and not predicate == RDF.type:
+                    if predicate in po_map:
+                        po_map[predicate].append(o)
+                    else:
+                        po_map[predicate] = [o]
+            
+            # ------ Constitution de la liste des catégories ------
+            # catégories communes de la classe :
+            # NB: les propriétés sont copiées, car leurs dictionnaires
+            # sont modifiés par la suite
+            class_key = (parent.rdfclass, parent.path)
+            if class_key in shared_properties:
+                shared, predicates = shared_properties[class_key]
+            else:
+                shared, predicates = class_properties(rdfclass=parent.rdfclass,
+                    nsm=self.nsm, base_path=parent.path, template=template)
+                shared_properties[class_key] = (shared, predicates)
+            properties = [p.copy() for p in shared]
+            if isinstance(parent, RootKey):
+                # prédicats connus, pour l'identification des
+                # catégories non référencées
+                predicates = set(predicates)
+                # catégories locales:
+                if template:
+                    for n3_path in template.local.keys():
+                        p = PlumeProperty(origin='local', nsm=self.nsm,
+                            n3_path=n3_path, template=template)
+                        properties.append(p)
+                        predicates.add(p.predicate)
+                # catégories non référencées
+                # en principe il s'agit simplement de catégories locales
+                # qui ne sont pas référencées par le modèle considéré
+                for predicate in po_map:
+                    if not predicate in predicates and not predicate == rdf_type:
                         properties.append(PlumeProperty(origin='unknown',
                             nsm=self.nsm, predicate=predicate))   
         
-        # ------ Boucle sur les catégories ------
-        for prop in properties:
-            prop_dict = prop.prop_dict
-            prop_dict['parent'] = parent
-            if not self.edit:
-                prop_dict['is_read_only'] = True
+            # ------ Boucle sur les catégories ------
+            for prop in properties:
+                prop_dict = prop.prop_dict
+                prop_dict['parent'] = parent
+                if not edit:
+                    prop_dict['is_read_only'] = True
             
-            # ------ Récupération des valeurs ------
-            # cas d'une propriété dont les valeurs sont mises à
-            # jour à partir d'informations disponibles côté serveur
-            if data and prop.n3_path in data:
-                values = data[prop.n3_path].copy() or [None]
-                if values != [None]:
-                    prop_dict['delayed'] = True
-                    # NB: permettra la mise à jour silencieuse
-                    # de propriétés non affichées
-            # sinon, on extrait la ou les valeurs éventuellement
-            # renseignées dans le graphe pour cette catégorie
-            # et le sujet considéré
-            elif metagraph:
-                values = [o for o in metagraph.objects(parent.node,
-                    prop.predicate)] or [None]
-            else:
-                values = [None]
+                # ------ Récupération des valeurs ------
+                # cas d'une propriété dont les valeurs sont mises à
+                # jour à partir d'informations disponibles côté serveur
+                if data and prop.n3_path in data:
+                    values = data[prop.n3_path].copy() or [None]
+                    if values != [None]:
+                        prop_dict['delayed'] = True
+                        # NB: permettra la mise à jour silencieuse
+                        # de propriétés non affichées
+                # sinon, on extrait la ou les valeurs éventuellement
+                # renseignées dans le graphe pour cette catégorie
+                # et le sujet considéré
+                elif metagraph and isinstance(prop.predicate, URIRef):
+                    values = po_map.get(prop.predicate, [None]).copy()
+                elif metagraph:
+                    # cas d'une catégorie locale définie par un chemin
+                    values = [o for o in metagraph.objects(parent.node,
+                        prop.predicate)] or [None]
+                else:
+                    values = [None]
+                # NB: `values` n'est jamais vide, l'absence de valeur
+                # est représentée par [None]
+                has_values = len(values) > 1 or values[0] is not None
 
-            # ------ Type des propriétés non référencées ------
-            if prop.origin == 'unknown':
-                prop_dict['datatype'] = main_datatype(values)
-                if not prop_dict['datatype']:
-                    prop_dict['rdfclass'] = RDFS.Resource
-                    # on aurait pu choisir n'importe quelle classe,
-                    # l'essentiel est qu'il y en ait une afin que
-                    # la valeur soit identifiée comme un IRI et non
-                    # un littéral.
+                # ------ Type des propriétés non référencées ------
+                if prop.origin == 'unknown':
+                    prop_dict['datatype'] = main_datatype(values)
+                    if not prop_dict['datatype']:
+                        prop_dict['rdfclass'] = RDFS.Resource
+                        # on aurait pu choisir n'importe quelle classe,
+                        # l'essentiel est qu'il y en ait une afin que
+                        # la valeur soit identifiée comme un IRI et non
+                        # un littéral.
 
-            # ------ Principales variables ------
-            kind = prop_dict.get('kind', SH.Literal)
-            multilingual = bool(prop_dict.get('unilang')) \
-                and prop_dict.get('datatype') == RDF.langString \
-                and self.translation
-            multiple = bool(prop_dict.get('is_multiple')) and self.edit \
-                and not bool(prop_dict.get('unilang'))
+                # ------ Principales variables ------
+                # lues une fois pour toutes, prop_dict n'étant plus
+                # modifié pour ces clés
+                get = prop_dict.get
+                kind = get('kind', sh_literal)
+                datatype = get('datatype')
+                unilang = bool(get('unilang'))
+                is_mandatory = get('is_mandatory')
+                unlisted = prop.unlisted
+                multilingual = unilang and datatype == langstring \
+                    and translation
+                multiple = bool(get('is_multiple')) and edit \
+                    and not unilang
 
-            # ------ Exclusion ------
-            # exclusion des catégories qui ne sont pas prévues par
-            # le modèle, ne sont pas considérées comme obligatoires
-            # par shape et n'ont pas de valeur renseignée.
-            # Les catégories obligatoires de shape sont affichées
-            # quoi qu'il arrive en mode édition.
-            # Les catégories sans valeur sont éliminées indépendamment
-            # du modèle quand hideBlank vaut True.
-            if values == [None] and (self.hideBlank or prop.unlisted) \
-                and not (self.edit and prop_dict.get('is_mandatory')):
-                continue
+                # ------ Exclusion ------
+                # exclusion des catégories qui ne sont pas prévues par
+                # le modèle, ne sont pas considérées comme obligatoires
+                # par shape et n'ont pas de valeur renseignée.
+                # Les catégories obligatoires de shape sont affichées
+                # quoi qu'il arrive en mode édition.
+                # Les catégories sans valeur sont éliminées indépendamment
+                # du modèle quand hideBlank vaut True.
+                if not has_values and (hideBlank or unlisted) \
+                    and not (edit and is_mandatory):
+                    continue
             
-            # ------ Fantômisation ------
-            # s'il y a une valeur, mais que hideUnlisted vaut True
-            # et que la catégorie n'est pas prévue par le modèle, on
-            # poursuit le traitement pour ne pas perdre la valeur, mais
-            # on ne créera pas de widget.
-            # Les catégories obligatoires de shape sont affichées quoi
-            # qu'il arrive.
-            if values != [None] and prop.unlisted and self.hideUnlisted \
-                and not prop_dict.get('is_mandatory'):
-                prop_dict['is_ghost'] = True
+                # ------ Fantômisation ------
+                # s'il y a une valeur, mais que hideUnlisted vaut True
+                # et que la catégorie n'est pas prévue par le modèle, on
+                # poursuit le traitement pour ne pas perdre la valeur, mais
+                # on ne créera pas de widget.
+                # Les catégories obligatoires de shape sont affichées quoi
+                # qu'il arrive.
+                if has_values and unlisted and hideUnlisted \
+                    and not is_mandatory:
+                    prop_dict['is_ghost'] = True
 
-            # ------ Choix de l'onglet ------
-            # pour les catégories de premier niveau
-            if isinstance(parent, RootKey):
-                if prop.unlisted:
-                    # les métadonnées hors modèle iront dans
-                    # l'onglet "Autres".
-                    prop_dict['parent'] = parent.search_tab('Autres')
-                else:
-                    tab_label = prop_dict.get('tab')
-                    prop_dict['parent'] = parent.search_tab(tab_label)
-                    # NB : renvoie le premier onglet si l'argument est None
+                # ------ Choix de l'onglet ------
+                # pour les catégories de premier niveau
+                if isinstance(parent, RootKey):
+                    if unlisted:
+                        # les métadonnées hors modèle iront dans
+                        # l'onglet "Autres".
+                        prop_dict['parent'] = tabs.get('Autres')
+                    else:
+                        tab_label = get('tab')
+                        prop_dict['parent'] = tabs.get(str(tab_label)) \
+                            if tab_label else first_tab
 
-            # ------ Affichage mono-langue ------
-            # si seules les métadonnées dans la langue principale
-            # doivent être affichées, on trie la liste pour qu'elles soient
-            # en tête. Dans tous les cas, la première valeur sera
-            # affichées, les autres seront des fantômes si elles
-            # ne sont pas dans la bonne langue.
-            if prop_dict.get('datatype') == RDF.langString \
-                and self.onlyCurrentLanguage:
-                sort_by_language(values, self.langlist)
+                # ------ Affichage mono-langue ------
+                # si seules les métadonnées dans la langue principale
+                # doivent être affichées, on trie la liste pour qu'elles soient
+                # en tête. Dans tous les cas, la première valeur sera
+                # affichées, les autres seront des fantômes si elles
+                # ne sont pas dans la bonne langue.
+                one_language = onlyCurrentLanguage and datatype == langstring
+                if one_language:
+                    sort_by_language(values, self.langlist)
 
-            # ------ Multi-valeurs ------
-            # création d'un groupe de valeurs ou de traduction
-            # rassemblant les valeurs actuelles et futures
-            if len(values) > 1 or multilingual or multiple:
-                if not self.edit:
-                    prop_dict['with_minus_buttons'] = False
-                if multilingual and not prop_dict.get('is_ghost'):
-                    groupkey = TranslationGroupKey(**prop_dict)
-                else:
-                    groupkey = GroupOfValuesKey(**prop_dict)
-                # les widgets référencés ensuite auront ce groupe pour parent
-                prop_dict['parent'] = groupkey
+                # ------ Multi-valeurs ------
+                # création d'un groupe de valeurs ou de traduction
+                # rassemblant les valeurs actuelles et futures
+                if len(values) > 1 or multilingual or multiple:
+                    if not edit:
+                        prop_dict['with_minus_buttons'] = False
+                    if multilingual and not get('is_ghost'):
+                        groupkey = TranslationGroupKey(**prop_dict)
+                    else:
+                        groupkey = GroupOfValuesKey(**prop_dict)
+                    # les widgets référencés ensuite auront ce groupe pour parent
+                    prop_dict['parent'] = groupkey
             
-            # ------ Boucle sur les valeurs ------
-            for value in values:
-                val_dict = prop_dict.copy()
+                # ------ Boucle sur les valeurs ------
+                # prop_dict n'est plus utilisé après la boucle s'il n'y a
+                # pas de bouton à créer, auquel cas la dernière valeur
+                # peut en faire usage sans copie (et, en particulier, une
+                # valeur unique)
+                last = len(values) - 1 if not (multilingual or multiple) \
+                    else -1
+                # nature des clés à créer pour chaque valeur, selon
+                # le type de noeud attendu
+                with_twins = kind == sh_bnode_or_iri
+                is_literal = kind == sh_literal
+                with_node = with_twins or kind == sh_bnode
+                with_value = with_twins or is_literal or kind == sh_iri
+                for i, value in enumerate(values):
+                    val_dict = prop_dict if i == last else prop_dict.copy()
+                    is_bnode = isinstance(value, BNode)
             
-                # ------ Affichage mono-langue (suite) ------
-                if val_dict.get('datatype') == RDF.langString \
-                    and self.onlyCurrentLanguage:
-                    if value and prop_dict['parent'].has_real_children and \
+                    # ------ Affichage mono-langue (suite) ------
+                    if one_language and value \
+                        and prop_dict['parent'].has_real_children and \
                         (not isinstance(value, Literal) or \
-                        value.language != self.main_language):
+                        value.language != main_language):
                         val_dict['is_ghost'] = True
                 
-                # ------ Cas d'un noeud anonyme -------
-                if kind in (SH.BlankNode, SH.BlankNodeOrIRI):
-                    if isinstance(value, BNode):
-                        val_dict['node'] = value
-                    # NB: on doit conserver les noeuds anonymes, sans quoi
-                    # il ne serait plus possible de récupérer les valeurs
-                    # dans le graphe
-                    nodekey = GroupOfPropertiesKey(**val_dict)
-                    self._build_tree(parent=nodekey, metagraph=metagraph,
-                        template=template, data=data)
-                    if kind == SH.BlankNodeOrIRI:
-                        val_dict['m_twin'] = nodekey
-                        val_dict['is_hidden_m'] = isinstance(value, BNode)
+                    # ------ Cas d'un noeud anonyme -------
+                    if with_node:
+                        if is_bnode:
+                            val_dict['node'] = value
+                        # NB: on doit conserver les noeuds anonymes, sans quoi
+                        # il ne serait plus possible de récupérer les valeurs
+                        # dans le graphe
+                        nodekey = GroupOfPropertiesKey(**val_dict)
+                        nodekeys.append(nodekey)
+                        if with_twins:
+                            val_dict['m_twin'] = nodekey
+                            val_dict['is_hidden_m'] = is_bnode
                     
-                # ------ Cas d'une valeur litéral ou d'un IRI ------
-                if kind in (SH.BlankNodeOrIRI, SH.Literal, SH.IRI):
-                    if isinstance(value, BNode):
-                        value = None
+                    # ------ Cas d'une valeur litéral ou d'un IRI ------
+                    if with_value:
+                        if is_bnode:
+                            value = None
+                        is_term = isinstance(value, uriref_or_literal)
                     
-                    # adaptation de is_long_text à la valeur
-                    if value and kind == SH.Literal \
-                        and len(str(value)) > self.valueLengthLimit:
-                        val_dict['is_long_text'] = True
+                        # adaptation de is_long_text à la valeur
+                        if value and is_literal \
+                            and len(str(value)) > valueLengthLimit:
+                            val_dict['is_long_text'] = True
                 
-                    # rowspan selon is_long_text
-                    if val_dict.get('is_long_text') and not 'rowspan' in val_dict:
-                        val_dict['rowspan'] = self.textEditRowSpan
+                        # rowspan selon is_long_text
+                        if val_dict.get('is_long_text') and not 'rowspan' in val_dict:
+                            val_dict['rowspan'] = textEditRowSpan
                 
-                    # étiquette séparée
-                    if val_dict.get('label') and (val_dict.get('is_long_text') or \
-                        len(str(val_dict['label'])) > self.labelLengthLimit):
-                        val_dict['independant_label'] = True
+                        # étiquette séparée
+                        if val_dict.get('label') and (val_dict.get('is_long_text') or \
+                            len(str(val_dict['label'])) > labelLengthLimit):
+                            val_dict['independant_label'] = True
                 
-                    if isinstance(value, (URIRef, Literal)):
-                        # source de la valeur
-                        if val_dict.get('sources') and isinstance(value, URIRef):
-                            val_dict['value_source'] = Thesaurus.concept_source(value)
-                        # value_language est déduit de value à l'initialisation
-                        # de la clé, le cas échéant
-                        val_dict['value'] = value
+                        if is_term:
+                            # source de la valeur
+                            if val_dict.get('sources') and isinstance(value, URIRef):
+                                val_dict['value_source'] = Thesaurus.concept_source(value)
+                            # value_language est déduit de value à l'initialisation
+                            # de la clé, le cas échéant
+                            val_dict['value'] = value
                     
-                    valkey = ValueKey(**val_dict)
+                        valkey = ValueKey(**val_dict)
                     
-                    if value is not None and not isinstance(value, (URIRef, Literal)):
-                        # cas d'une valeur issue de data, par exemple.
-                        # on saisit la valeur après la création de la clé,
-                        # pour pouvoir la dé-sérialiser en fonction des
-                        # attributs de la clé
-                        self.update_value(valkey, value, override=True)
+                        if value is not None and not is_term:
+                            # cas d'une valeur issue de data, par exemple.
+                            # on saisit la valeur après la création de la clé,
+                            # pour pouvoir la dé-sérialiser en fonction des
+                            # attributs de la clé
+                            self.update_value(valkey, value, override=True)
                 
-            # ------ Bouton ------
-            if multilingual or multiple:
-                buttonkey = TranslationButtonKey(**prop_dict) if multilingual \
-                    else PlusButtonKey(**prop_dict)
+                # ------ Bouton ------
+                if multilingual or multiple:
+                    buttonkey = TranslationButtonKey(**prop_dict) if multilingual \
+                        else PlusButtonKey(**prop_dict)
+
+            # ------ Groupes de propriétés à explorer ------
+            # empilés en ordre inverse, pour être traités
+            # dans l'ordre de leur création
+            stack.extend(reversed(nodekeys))
 
     @property
     def edit(self):
@@ -515,7 +690,51 @@ class WidgetsDict(dict):
         if widgetkey.parent:
             return self[widgetkey.parent].get('grid widget')
 
-    def internalize(self, widgetkey):
+    def thesaurus_label(self, source):
+        """Renvoie le libellé d'un thésaurus dans les langues du dictionnaire.
+        
+        Le résultat est mémorisé, de sorte que les appels suivants pour
+        la même source ne sollicitent plus :py:class:`plume.rdf.thesaurus.Thesaurus`.
+        
+        Parameters
+        ----------
+        source : rdflib.term.URIRef
+            L'IRI du thésaurus.
+        
+        Returns
+        -------
+        str
+        
+        """
+        label = self._thesaurus_labels.get(source)
+        if label is None:
+            label = Thesaurus.get_label((source, self.langlist))
+            self._thesaurus_labels[source] = label
+        return label
+
+    def thesaurus_values(self, source):
+        """Renvoie les termes d'un thésaurus dans les langues du dictionnaire.
+        
+        Le résultat est mémorisé, de sorte que les appels suivants pour
+        la même source ne sollicitent plus :py:class:`plume.rdf.thesaurus.Thesaurus`.
+        
+        Parameters
+        ----------
+        source : rdflib.term.URIRef
+            L'IRI du thésaurus.
+        
+        Returns
+        -------
+        list(str)
+        
+        """
+        values = self._thesaurus_values.get(source)
+        if values is None:
+            values = Thesaurus.get_values((source, self.langlist))
+            self._thesaurus_values[source] = values
+        return values
+
+    def internalize(self, widgetkey, internaldict=None):
         """Retranscrit les attributs d'une clé dans le dictionnaire interne associé.
         
         Si la clé n'était pas référencée dans le dictionnaire de widgets,
@@ -526,6 +745,10 @@ class WidgetsDict(dict):
         widgetkey : plume.rdf.widgetkey.WidgetKey
             Une clé du dictionnaire de widgets. Si la clé n'est pas encore
             référencée dans le dictionnaire, elle le sera.
+        internaldict : plume.rdf.internaldict.InternalDict, optional
+            Le dictionnaire interne de la clé, s'il a déjà été obtenu
+            par l'appelant. Il est alors utilisé tel quel, sans nouvelle
+            recherche dans le dictionnaire de widgets.
         
         Raises
         ------
@@ -538,89 +761,139 @@ class WidgetsDict(dict):
             raise IntegrityBreach('Les clés fantômes ne doivent pas être ' \
                 'référencées dans le dictionnaire de widgets.', widgetkey=widgetkey)
         
-        if widgetkey in self:
-            internaldict = self[widgetkey]
-        else:
-            internaldict = InternalDict()
-            self[widgetkey] = internaldict
+        if internaldict is None:
+            internaldict = self.get(widgetkey)
+            if internaldict is None:
+                internaldict = InternalDict()
+                self[widgetkey] = internaldict
    
         internaldict['object'] = widgetkey.key_object
         internaldict['main widget type'] = self.widget_type(widgetkey)
-        
-        if isinstance(widgetkey, RootKey):
-            return
-            
-        if isinstance(widgetkey, (GroupKey, ObjectKey)):
-            internaldict['label'] = widgetkey.label
-            
-        if isinstance(widgetkey, TabKey):
-            return
-        
+        self._internalizers[type(widgetkey)](self, widgetkey, internaldict)
+
+    # ------ Retranscription selon la classe de la clé ------
+    # Les méthodes suivantes complètent le dictionnaire interne
+    # `internaldict` de la clé `widgetkey`, après que
+    # :py:meth:`WidgetsDict.internalize` y a inscrit les
+    # attributs communs à toutes les clés. Elles sont appelées
+    # par l'intermédiaire de `_internalizers`, selon la classe
+    # exacte de la clé.
+
+    def _internalize_root(self, widgetkey, internaldict):
+        return
+
+    def _internalize_tab(self, widgetkey, internaldict):
+        internaldict['label'] = widgetkey.label
+
+    def _internalize_button(self, widgetkey, internaldict):
+        self._internalize_common(widgetkey, internaldict)
+
+    def _internalize_group_of_values(self, widgetkey, internaldict):
+        internaldict['label'] = widgetkey.label
+        self._internalize_common(widgetkey, internaldict)
+        self._internalize_compute(widgetkey, internaldict)
+
+    def _internalize_group_of_properties(self, widgetkey, internaldict):
+        internaldict['label'] = widgetkey.label
+        self._internalize_common(widgetkey, internaldict)
+        internaldict['has minus button'] = widgetkey.has_minus_button
+        internaldict['hide minus button'] = widgetkey.has_minus_button \
+            and widgetkey.is_single_child
+        if widgetkey.has_source_button:
+            if widgetkey.sources:
+                thesaurus_label = self.thesaurus_label
+                internaldict['sources'] = [thesaurus_label(s) \
+                    for s in widgetkey.sources]
+            else:
+                internaldict['sources'] = ['< URI >']
+            if widgetkey.m_twin:
+                internaldict['sources'].insert(0, '< manuel >')
+                internaldict['current source'] = '< manuel >'
+
+    def _internalize_value(self, widgetkey, internaldict):
+        internaldict['label'] = widgetkey.label
+        self._internalize_common(widgetkey, internaldict)
+        self._internalize_compute(widgetkey, internaldict)
+        internaldict['placeholder text'] = widgetkey.placeholder
+        internaldict['input mask'] = widgetkey.input_mask
+        internaldict['is mandatory'] = widgetkey.is_mandatory
+        internaldict['regex validator pattern'] = widgetkey.regex_validator
+        internaldict['regex validator flags'] = widgetkey.regex_validator_flags
+        # NB: pas de validateur pour une clé en lecture seule, ni
+        # de représentation textuelle en l'absence de valeur, les
+        # méthodes dédiées ne sont appelées qu'en cas de besoin
+        is_read_only = widgetkey.is_read_only
+        internaldict['type validator'] = None if is_read_only \
+            else self.type_validator(widgetkey)
+        internaldict['read only'] = is_read_only
+        internaldict['value'] = None if widgetkey.value is None \
+            else self.str_value(widgetkey)
+        value_language = widgetkey.value_language
+        internaldict['language value'] = value_language
+        if widgetkey.has_language_button:
+            available_languages = widgetkey.available_languages
+            internaldict['authorized languages'] = available_languages.copy() \
+                if value_language in available_languages \
+                else [value_language] + available_languages
+        if not is_read_only and not widgetkey.has_source_button \
+            and widgetkey.value_source:
+            # cas où il n'y a qu'une seule source, le multi-sources
+            # est traité juste après
+            internaldict['thesaurus values'] = self.thesaurus_values(
+                widgetkey.value_source)
+        if widgetkey.has_unit_button:
+            internaldict['units'] = widgetkey.units.copy()
+            internaldict['current unit'] = widgetkey.value_unit
+        if widgetkey.has_geo_button:
+            internaldict['geo tools'] = widgetkey.geo_tools
+        
+        internaldict['has minus button'] = widgetkey.has_minus_button
+        internaldict['hide minus button'] = widgetkey.has_minus_button \
+            and widgetkey.is_single_child
+        if widgetkey.has_source_button:
+            if widgetkey.sources:
+                thesaurus_label = self.thesaurus_label
+                internaldict['sources'] = [thesaurus_label(s) \
+                    for s in widgetkey.sources]
+                if widgetkey.value_source:
+                    internaldict['current source'] = thesaurus_label(
+                        widgetkey.value_source)
+                    internaldict['thesaurus values'] = self.thesaurus_values(
+                        widgetkey.value_source)
+                else:
+                    internaldict['current source'] = '< non référencé >'
+                    internaldict['sources'].insert(0, '< non référencé >')
+            else:
+                internaldict['sources'] = ['< URI >']
+                internaldict['current source'] = '< URI >'
+            if widgetkey.m_twin:
+                internaldict['sources'].insert(0, '< manuel >')
+
+    def _internalize_common(self, widgetkey, internaldict):
         internaldict['help text'] = widgetkey.description
         internaldict['hidden'] = widgetkey.is_hidden
         internaldict['multiple sources'] = widgetkey.has_source_button
         internaldict['has label'] = widgetkey.has_label
-        
-        if isinstance(widgetkey, (ValueKey, GroupOfValuesKey)) and widgetkey.compute \
+
+    def _internalize_compute(self, widgetkey, internaldict):
+        if widgetkey.compute \
             and ('auto' in widgetkey.compute or widgetkey.has_compute_button):
             method = computation_method(widgetkey.path)
             if method:
                 internaldict['has compute button'] = widgetkey.has_compute_button
                 internaldict['compute method'] = method
                 internaldict['auto compute'] = 'auto' in widgetkey.compute
-        
-        if isinstance(widgetkey, ValueKey):
-            internaldict['placeholder text'] = widgetkey.placeholder
-            internaldict['input mask'] = widgetkey.input_mask
-            internaldict['is mandatory'] = widgetkey.is_mandatory
-            internaldict['regex validator pattern'] = widgetkey.regex_validator
-            internaldict['regex validator flags'] = widgetkey.regex_validator_flags
-            internaldict['type validator'] = self.type_validator(widgetkey)
-            internaldict['read only'] = widgetkey.is_read_only
-            internaldict['value'] = self.str_value(widgetkey)
-            internaldict['language value'] = widgetkey.value_language
-            if widgetkey.has_language_button:
-                internaldict['authorized languages'] = widgetkey.available_languages.copy()
-                if not widgetkey.value_language in widgetkey.available_languages:
-                    internaldict['authorized languages'].insert(0, widgetkey.value_language)
-            if not widgetkey.has_source_button and widgetkey.value_source \
-                and not widgetkey.is_read_only:
-                # cas où il n'y a qu'une seule source, le multi-sources
-                # est traité juste après
-                internaldict['thesaurus values'] = Thesaurus.get_values(
-                    (widgetkey.value_source, self.langlist))
-            if widgetkey.has_unit_button:
-                internaldict['units'] = widgetkey.units.copy()
-                internaldict['current unit'] = widgetkey.value_unit
-            if widgetkey.has_geo_button:
-                internaldict['geo tools'] = widgetkey.geo_tools
-
-        if isinstance(widgetkey, ObjectKey):
-            internaldict['has minus button'] = widgetkey.has_minus_button
-            internaldict['hide minus button'] = widgetkey.has_minus_button \
-                and widgetkey.is_single_child
-            if widgetkey.has_source_button:
-                if widgetkey.sources:
-                    internaldict['sources'] = [Thesaurus.get_label((s, self.langlist)) \
-                        for s in widgetkey.sources]
-                    if isinstance(widgetkey, ValueKey):
-                        if widgetkey.value_source:
-                            internaldict['current source'] = Thesaurus.get_label(
-                                (widgetkey.value_source, self.langlist))
-                            internaldict['thesaurus values'] = Thesaurus.get_values(
-                                (widgetkey.value_source, self.langlist))
-                        else:
-                            internaldict['current source'] = '< non référencé >'
-                            internaldict['sources'].insert(0, '< non référencé >')
-                else:
-                    internaldict['sources'] = ['< URI >']
-                    if isinstance(widgetkey, ValueKey):
-                        internaldict['current source'] = '< URI >'
-                if widgetkey.m_twin:
-                    internaldict['sources'].insert(0, '< manuel >')
-                    if isinstance(widgetkey, GroupOfPropertiesKey): 
-                        internaldict['current source'] = '< manuel >'
 
+    _internalizers = {
+        RootKey: _internalize_root,
+        TabKey: _internalize_tab,
+        GroupOfPropertiesKey: _internalize_group_of_properties,
+        GroupOfValuesKey: _internalize_group_of_values,
+        TranslationGroupKey: _internalize_group_of_values,
+        ValueKey: _internalize_value,
+        PlusButtonKey: _internalize_button,
+        TranslationButtonKey: _internalize_button
+        }
 
     def widget_placement(self, widgetkey, kind):
         """Renvoie les paramètres de placement du widget dans la grille.
@@ -1018,7 +1291,7 @@ class WidgetsDict(dict):
                 # l'initialisation du dictionnaire de widgets, donc
                 # cette boucle sur deux ou trois valeurs maximum
                 # ne coûte pas grand chose
-                if Thesaurus.get_label((s, self.langlist)) == new_source:
+                if self.thesaurus_label(s) == new_source:
                     value_source = s
                     break
         
@@ -1091,13 +1364,11 @@ class WidgetsDict(dict):
         """
         if not widgetkey:
             return
-        if isinstance(widgetkey, RootKey):
-            return None
-        if isinstance(widgetkey, GroupKey):
-            return 'QGroupBox'
-        if isinstance(widgetkey, PlusButtonKey):
-            return 'QToolButton'
-        if widgetkey.datatype == XSD.boolean:
+        key_class = type(widgetkey)
+        if key_class in _KEY_CLASS_TO_WIDGET:
+            return _KEY_CLASS_TO_WIDGET[key_class]
+        datatype = widgetkey.datatype
+        if datatype == XSD.boolean:
             return 'QCheckBox'
         if widgetkey.is_read_only:
             return 'QLabel'
@@ -1105,12 +1376,7 @@ class WidgetsDict(dict):
             return 'QComboBox'
         if widgetkey.is_long_text:
             return 'QTextEdit'
-        d = {
-            XSD.date: 'QDateEdit',
-            XSD.dateTime: 'QDateTimeEdit',
-            XSD.time: 'QTimeEdit'
-            }
-        return d.get(widgetkey.datatype, 'QLineEdit')
+        return _DATATYPE_TO_WIDGET.get(datatype, 'QLineEdit')
     
     def type_validator(self, widgetkey):
         """S'il y a lieu, renvoie le validateur adapté pour une clé.
@@ -1123,14 +1389,7 @@ class WidgetsDict(dict):
         """
         if not widgetkey or widgetkey.is_read_only:
             return
-        d = {
-            XSD.integer: 'QIntValidator',
-            XSD.decimal: 'QDoubleValidator',
-            XSD.float: 'QDoubleValidator',
-            XSD.double: 'QDoubleValidator',
-            XSD.duration: 'QIntValidator'
-            }
-        return d.get(widgetkey.datatype)
+        return _DATATYPE_TO_VALIDATOR.get(widgetkey.datatype)
     
     def computing_query(self, widgetkey, schema_name, table_name):
         """Renvoie la requête de calcul de la métadonnée côté serveur.
@@ -1200,7 +1459,7 @@ class WidgetsDict(dict):
         """
         method = self[widgetkey]['compute method']
         if not method or result is None:
-            return self.dictisize_actionsbook(ActionsBook())
+            return self.dictisize_actionsbook(WidgetKey.EMPTY_ACTIONSBOOK)
         WidgetKey.clear_actionsbook()
         # on réinitialise ici le carnet d'actions. Ensuite il
         # sera complété au fur et à mesure et non réinitialisé
@@ -1284,36 +1543,42 @@ class WidgetsDict(dict):
         if not isinstance(widgetkey, ValueKey) or value in (None, ''):
             return
         # type RDF.langString
-        if widgetkey.value_language:
-            return Literal(str(value), lang=widgetkey.value_language)
+        language = widgetkey.value_language
+        if language:
+            value = str(value)
+            current = widgetkey.value
+            # valeur inchangée, par exemple lors de l'enregistrement
+            # de l'ensemble du formulaire
+            if isinstance(current, Literal) and current.language == language \
+                and str(current) == value:
+                return current
+            return langstring_from_str(value, language)
+        datatype = widgetkey.datatype
         # type XSD.boolean
-        elif widgetkey.datatype == XSD.boolean:
+        if datatype == XSD.boolean:
             return Literal(bool(value), datatype=XSD.boolean)
         # type XSD.duration
         elif widgetkey.value_unit:
             return duration_from_int(value, widgetkey.value_unit)
-        # type XSD.date
-        elif widgetkey.datatype == XSD.date:
-            return date_from_str(str(value))
-        # type XSD.dateTime
-        elif widgetkey.datatype == XSD.dateTime:
-            return datetime_from_str(str(value))
-        # type XSD.time
-        elif widgetkey.datatype == XSD.time:
-            return time_from_str(str(value))
-        # type XSD.decimal
-        elif widgetkey.datatype == XSD.decimal:
-            return decimal_from_str(str(value))
+        # types XSD.date, XSD.dateTime, XSD.time, XSD.decimal
+        elif datatype in _DATATYPE_FROM_STR:
+            return _DATATYPE_FROM_STR[datatype](str(value))
         # type XSD.string
-        elif widgetkey.datatype == XSD.string:
+        elif datatype == XSD.string:
             return Literal(str(value))
-        elif widgetkey.datatype:
+        elif datatype:
             # type XSD.integer
-            if widgetkey.datatype == XSD.integer and not (isinstance(value, int) \
+            if datatype == XSD.integer and not (isinstance(value, int) \
                 or str(value).isdecimal()):
                 return
             else:
-                return Literal(str(value), datatype=widgetkey.datatype)
+                value = str(value)
+                current = widgetkey.value
+                if isinstance(current, Literal) \
+                    and current.datatype == datatype \
+                    and str(current) == value:
+                    return current
+                return Literal(value, datatype=datatype)
         # IRI avec valeur issue d'un thésaurus
         elif widgetkey.value_source:
             res = Thesaurus.concept_iri((widgetkey.value_source, \
@@ -1323,11 +1588,10 @@ class WidgetsDict(dict):
         else:
             f = forbidden_char(str(value))
             if not f:
-                if widgetkey.transform == 'email':
-                    return owlthing_from_email(str(value))
-                if widgetkey.transform == 'phone':
-                    return owlthing_from_tel(str(value))
-                return URIRef(str(value))
+                transform = widgetkey.transform
+                if transform:
+                    return _TRANSFORM_TO_IRI[transform](str(value))
+                return uriref_from_str(str(value))
     
     def update_value(self, widgetkey, value, override=False):
         """Prépare et enregistre une valeur dans une clé-valeur du dictionnaire de widgets.
@@ -1349,8 +1613,44 @@ class WidgetsDict(dict):
             or (widgetkey.is_read_only and not override):
             return
         widgetkey.value = self.prepare_value(widgetkey, value)
-        if widgetkey in self:
-            self.internalize(widgetkey)
+        internaldict = self.get(widgetkey)
+        if internaldict is not None:
+            self.internalize(widgetkey, internaldict)
+    
+    def update_values(self, values, override=False):
+        """Prépare et enregistre des valeurs dans plusieurs clés-valeurs du dictionnaire de widgets.
+        
+        Cette méthode est l'équivalent de :py:meth:`WidgetsDict.update_value`
+        pour un ensemble de clés, typiquement toutes les clés-valeurs
+        du formulaire lors de son enregistrement. Les dictionnaires
+        internes des clés dont la valeur n'a pas changé ne sont
+        pas recalculés.
+        
+        Parameters
+        ----------
+        values : iterable of tuple(plume.rdf.widgetkey.ValueKey, str)
+            Les couples formés d'une clé-valeur de dictionnaire de
+            widgets et de la valeur à lui attribuer, exprimée sous la
+            forme d'une chaîne de caractères.
+        override : bool, default False
+            Si ``True``, permet de modifier la valeur de clés
+            en lecture seule.
+        
+        """
+        get = self.get
+        prepare_value = self.prepare_value
+        for widgetkey, value in values:
+            if not isinstance(widgetkey, ValueKey) \
+                or (widgetkey.is_read_only and not override):
+                continue
+            old_value = widgetkey.value
+            new_value = prepare_value(widgetkey, value)
+            widgetkey.value = new_value
+            if new_value == old_value:
+                continue
+            internaldict = get(widgetkey)
+            if internaldict is not None:
+                self.internalize(widgetkey, internaldict)
     
     def str_value(self, widgetkey):
         """Renvoie la valeur d'une clé-valeur du dictionnaire de widgets sous forme d'une chaîne de caractères.
@@ -1371,41 +1671,40 @@ class WidgetsDict(dict):
         value = widgetkey.value
         if value is None:
             return
+        transform = widgetkey.transform
+        value_source = widgetkey.value_source
+        datatype = widgetkey.datatype
+        is_read_only = widgetkey.is_read_only
         str_value = None
-        tmap = {XSD.integer: int, XSD.boolean: bool}
-        if widgetkey.transform == 'email':
-            str_value = email_from_owlthing(value)
-        elif widgetkey.transform == 'phone':
-            str_value = tel_from_owlthing(value)
-        elif widgetkey.value_source:
-            str_value = Thesaurus.concept_str((widgetkey.value_source, \
+        if transform:
+            str_value = _TRANSFORM_FROM_IRI[transform](value)
+        # cas le plus courant : chaîne de caractères, avec
+        # ou sans langue, restituée telle quelle
+        elif datatype in _TEXT_DATATYPES:
+            str_value = str(value)
+        elif value_source:
+            str_value = Thesaurus.concept_str((value_source, \
                 widgetkey.main_language), value)
         elif widgetkey.value_unit:
-            if widgetkey.is_read_only:
+            if is_read_only:
                 str_value = str_from_duration(value)
             else:
                 str_value = str(int_from_duration(value)[0])
-        elif widgetkey.datatype == XSD.date:
-            str_value = str_from_date(value)
-        elif widgetkey.datatype == XSD.dateTime:
-            str_value = str_from_datetime(value)
-        elif widgetkey.datatype == XSD.time:
-            str_value = str_from_time(value)
-        elif widgetkey.datatype == XSD.decimal:
-            str_value = str_from_decimal(value)
-        elif widgetkey.datatype in tmap:
+        elif datatype in _DATATYPE_TO_STR:
+            str_value = _DATATYPE_TO_STR[datatype](value)
+        elif datatype in _DATATYPE_TO_PYTHON:
             py_value = value.toPython()
-            if not isinstance(py_value, tmap[widgetkey.datatype]):
+            if not isinstance(py_value, _DATATYPE_TO_PYTHON[datatype]):
                 str_value = None
             else:
                 str_value = str(py_value)
         else:
             str_value = str(value)
-        if widgetkey.is_read_only:
-            if widgetkey.value_source:
+        if is_read_only:
+            if value_source:
                 str_value = text_with_link(
                     str_value,
-                    Thesaurus.concept_link((widgetkey.value_source, \
+                    Thesaurus.concept_link((value_source, \
                         widgetkey.main_language), value) or value
                     )
             elif isinstance(value, URIRef):